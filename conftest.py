@@ -0,0 +1,89 @@
+"""
+Repository-wide pytest configuration
+
+Loaded for every Python test under the repository root, including the
+per-module integration tests in src/modules/*/ and the suites in tests/.
+"""
+
+import functools
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture
+def tmp_path(tmp_path):
+    """
+    Per-test temporary directory that is removed when the test finishes
+
+    Mimic runs write full output trees into tmp_path. pytest keeps the last
+    few sessions' directories by default, so delete each one eagerly to keep
+    repeated (and parallel) runs from piling up output on disk.
+    """
+    yield tmp_path
+    shutil.rmtree(tmp_path, ignore_errors=True)
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "requires_modules(*names): skip unless Mimic was built with these modules "
+        "(the test module must provide an available_modules fixture)",
+    )
+    # Registered by pytest-xdist too; repeated here so runs without it stay quiet
+    config.addinivalue_line(
+        "markers",
+        "xdist_group(name): run every test in the group on the same xdist worker "
+        "(takes effect with --dist loadgroup)",
+    )
+
+
+@pytest.fixture(autouse=True)
+def _skip_if_modules_missing(request):
+    """Skip tests marked requires_modules(...) before their body runs"""
+    marker = request.node.get_closest_marker("requires_modules")
+    if marker is None:
+        return
+
+    available = request.getfixturevalue("available_modules")
+    missing = [m for m in marker.args if m not in available]
+    if missing:
+        pytest.skip(f"missing modules: {missing}")
+
+
+def _worker_prefix():
+    """Temp directory name prefix carrying the pytest-xdist worker id"""
+    return f"mimic_{os.environ.get('PYTEST_XDIST_WORKER', 'main')}_"
+
+
+@pytest.fixture(scope="session")
+def mimic_tmp():
+    """Session-wide temporary directory for parameter files and Mimic output"""
+    path = Path(tempfile.mkdtemp(prefix=_worker_prefix()))
+    yield path
+    shutil.rmtree(path, ignore_errors=True)
+
+
+@pytest.fixture
+def mimic_param_file(tmp_path):
+    """
+    Factory for harness parameter files, with output under tmp_path
+
+    Every test, and so every pytest-xdist worker, gets its own output tree,
+    which lets independent Mimic runs proceed in parallel without sharing
+    tests/data/output/. The parameter files themselves go to a scratch
+    directory in RAM-backed storage where available; the output stays on
+    the normal temp path, since a full tree could fill a small tmpfs.
+
+    Usage:
+        param_file, output_dir, _ = mimic_param_file("run", enabled_modules=[...])
+    """
+    from framework import create_test_param_file, scratch_dir
+
+    param_dir = scratch_dir(prefix=_worker_prefix())
+    yield functools.partial(create_test_param_file, temp_dir=tmp_path,
+                            param_dir=param_dir)
+    shutil.rmtree(param_dir, ignore_errors=True)
@@ -43,10 +43,11 @@ MIMIC_EXE = REPO_ROOT / "mimic"
 
 # Add tests directory to path to import framework
 sys.path.insert(0, str(REPO_ROOT / "tests"))
-from framework import load_binary_halos
+from framework import load_binary_halos, scratch_dir
 
 # Test state
 temp_dir = None
+param_dir = None  # Parameter files only (RAM-backed where available)
 ref_param_file = None
 
 # ANSI color codes
@@ -67,7 +68,7 @@ def get_available_modules():
     import yaml
 
     try:
-        test_param = temp_dir / "_query_modules.yaml"
+        test_param = param_dir / "_query_modules.yaml"
 
         with open(ref_param_file, 'r') as f:
             config = yaml.safe_load(f)
@@ -76,7 +77,7 @@ def get_available_modules():
         config['output']['format'] = 'binary'
 
         with open(test_param, 'w') as f:
-            yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+            f.write(yaml.dump(config, default_flow_style=False, sort_keys=False))
 
         result = subprocess.run(
             [str(MIMIC_EXE), str(test_param)],
@@ -112,12 +113,13 @@ def get_available_modules():
 
 def setup():
     """Set up test environment and temp directory"""
-    global temp_dir, ref_param_file
+    global temp_dir, param_dir, ref_param_file
 
     print(f"{BLUE}Setting up test environment...{NC}")
 
-    # Create temp directory
+    # Create temp directories (outputs on the normal temp path)
     temp_dir = Path(tempfile.mkdtemp(prefix="test_sage_disk_instability_"))
+    param_dir = scratch_dir(prefix="test_sage_disk_instability_")
 
     # Reference parameter file
     ref_param_file = REPO_ROOT / "tests" / "data" / "test_binary.yaml"
@@ -136,8 +138,10 @@ def setup():
 
 def teardown():
     """Clean up test environment"""
-    global temp_dir
+    global temp_dir, param_dir
 
+    if param_dir and param_dir.exists():
+        shutil.rmtree(param_dir)
     if temp_dir and temp_dir.exists():
         shutil.rmtree(temp_dir)
         print(f"{GREEN}✓{NC} Cleaned up temp directory")
@@ -166,7 +170,7 @@ def test_output_properties_exist():
 
     print(f"\n{BLUE}Test: Output properties exist{NC}")
 
-    test_param = temp_dir / "test_properties.yaml"
+    test_param = param_dir / "test_properties.yaml"
 
     with open(ref_param_file, 'r') as f:
         config = yaml.safe_load(f)
@@ -176,7 +180,7 @@ def test_output_properties_exist():
     config['output']['format'] = 'binary'
 
     with open(test_param, 'w') as f:
-        yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+        f.write(yaml.dump(config, default_flow_style=False, sort_keys=False))
 
     # Run Mimic
     result = subprocess.run(
@@ -235,7 +239,7 @@ def test_parameters_configurable():
 
     print(f"\n{BLUE}Test: Parameters configurable{NC}")
 
-    test_param = temp_dir / "test_params.yaml"
+    test_param = param_dir / "test_params.yaml"
 
     with open(ref_param_file, 'r') as f:
         config = yaml.safe_load(f)
@@ -253,7 +257,7 @@ def test_parameters_configurable():
     config['modules']['parameters']['SageDiskInstability']['DiskRadiusFactor'] = 5.0
 
     with open(test_param, 'w') as f:
-        yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+        f.write(yaml.dump(config, default_flow_style=False, sort_keys=False))
 
     # Run Mimic
     result = subprocess.run(
@@ -283,7 +287,7 @@ def test_stability_physics():
 
     print(f"\n{BLUE}Test: Disk stability physics{NC}")
 
-    test_param = temp_dir / "test_stability.yaml"
+    test_param = param_dir / "test_stability.yaml"
 
     with open(ref_param_file, 'r') as f:
         config = yaml.safe_load(f)
@@ -293,7 +297,7 @@ def test_stability_physics():
     config['output']['format'] = 'binary'
 
     with open(test_param, 'w') as f:
-        yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+        f.write(yaml.dump(config, default_flow_style=False, sort_keys=False))
 
     # Run Mimic
     result = subprocess.run(
@@ -352,7 +356,7 @@ def test_stellar_conservation():
 
     print(f"\n{BLUE}Test: Stellar mass conservation{NC}")
 
-    test_param = temp_dir / "test_conservation.yaml"
+    test_param = param_dir / "test_conservation.yaml"
 
     with open(ref_param_file, 'r') as f:
         config = yaml.safe_load(f)
@@ -362,7 +366,7 @@ def test_stellar_conservation():
     config['output']['format'] = 'binary'
 
     with open(test_param, 'w') as f:
-        yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+        f.write(yaml.dump(config, default_flow_style=False, sort_keys=False))
 
     # Run Mimic
     result = subprocess.run(
@@ -418,7 +422,7 @@ def test_memory_safety():
 
     print(f"\n{BLUE}Test: Memory safety{NC}")
 
-    test_param = temp_dir / "test_memory.yaml"
+    test_param = param_dir / "test_memory.yaml"
 
     with open(ref_param_file, 'r') as f:
         config = yaml.safe_load(f)
@@ -428,7 +432,7 @@ def test_memory_safety():
     config['output']['format'] = 'binary'
 
     with open(test_param, 'w') as f:
-        yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+        f.write(yaml.dump(config, default_flow_style=False, sort_keys=False))
 
     # Run Mimic
     result = subprocess.run(
@@ -471,7 +475,7 @@ def test_execution_completes():
 
     print(f"\n{BLUE}Test: Execution completes{NC}")
 
-    test_param = temp_dir / "test_completion.yaml"
+    test_param = param_dir / "test_completion.yaml"
 
     with open(ref_param_file, 'r') as f:
         config = yaml.safe_load(f)
@@ -481,7 +485,7 @@ def test_execution_completes():
     config['output']['format'] = 'binary'
 
     with open(test_param, 'w') as f:
-        yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+        f.write(yaml.dump(config, default_flow_style=False, sort_keys=False))
 
     # Run Mimic
     result = subprocess.run(
@@ -523,7 +527,7 @@ def test_multiple_module_pipeline():
         print(f"{YELLOW}⚠ SKIP{NC}: Not enough modules available for multi-module test")
         return True
 
-    test_param = temp_dir / "test_multi.yaml"
+    test_param = param_dir / "test_multi.yaml"
 
     with open(ref_param_file, 'r') as f:
         config = yaml.safe_load(f)
@@ -533,7 +537,7 @@ def test_multiple_module_pipeline():
     config['output']['format'] = 'binary'
 
     with open(test_param, 'w') as f:
-        yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+        f.write(yaml.dump(config, default_flow_style=False, sort_keys=False))
 
     # Run Mimic
     result = subprocess.run(
@@ -41,10 +41,11 @@ MIMIC_EXE = REPO_ROOT / "mimic"
 
 # Add tests directory to path to import framework
 sys.path.insert(0, str(REPO_ROOT / "tests"))
-from framework import load_binary_halos
+from framework import load_binary_halos, scratch_dir
 
 # Test state
 temp_dir = None
+param_dir = None  # Parameter files only (RAM-backed where available)
 ref_param_file = None
 
 # ANSI color codes
@@ -65,7 +66,7 @@ def get_available_modules():
     import yaml
 
     try:
-        test_param = temp_dir / "_query_modules.yaml"
+        test_param = param_dir / "_query_modules.yaml"
 
         with open(ref_param_file, 'r') as f:
             config = yaml.safe_load(f)
@@ -74,7 +75,7 @@ def get_available_modules():
         config['output']['format'] = 'binary'
 
         with open(test_param, 'w') as f:
-            yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+            f.write(yaml.dump(config, default_flow_style=False, sort_keys=False))
 
         result = subprocess.run(
             [str(MIMIC_EXE), str(test_param)],
@@ -127,42 +128,6 @@ def run_mimic(param_file):
     return result.returncode, result.stdout, result.stderr
 
 
-def read_param_file(param_file):
-    """Read YAML parameter file and return as dictionary."""
-    import yaml
-
-    with open(param_file, 'r') as f:
-        config = yaml.safe_load(f)
-
-    # Flatten hierarchical structure
-    params = {}
-    if 'output' in config:
-        params['OutputFileBaseName'] = config['output'].get('file_base_name', 'model')
-        params['OutputDir'] = config['output'].get('directory', './')
-        params['OutputFormat'] = config['output'].get('format', 'binary')
-    if 'input' in config:
-        params['FirstFile'] = str(config['input'].get('first_file', 0))
-        params['LastFile'] = str(config['input'].get('last_file', 0))
-        params['TreeName'] = config['input'].get('tree_name', '')
-        params['TreeType'] = config['input'].get('tree_type', 'lhalo_binary')
-        params['SimulationDir'] = config['input'].get('simulation_dir', './')
-        params['FileWithSnapList'] = config['input'].get('snapshot_list_file', '')
-        params['LastSnapshotNr'] = str(config['input'].get('last_snapshot', 0))
-    if 'simulation' in config:
-        params['BoxSize'] = str(config['simulation'].get('box_size', 0.0))
-        params['PartMass'] = str(config['simulation'].get('particle_mass', 0.0))
-        if 'cosmology' in config['simulation']:
-            params['Omega'] = str(config['simulation']['cosmology'].get('omega_matter', 0.0))
-            params['OmegaLambda'] = str(config['simulation']['cosmology'].get('omega_lambda', 0.0))
-            params['Hubble_h'] = str(config['simulation']['cosmology'].get('hubble_h', 0.0))
-    if 'units' in config:
-        params['UnitLength_in_cm'] = str(config['units'].get('length_in_cm', 0.0))
-        params['UnitMass_in_g'] = str(config['units'].get('mass_in_g', 0.0))
-        params['UnitVelocity_in_cm_per_s'] = str(config['units'].get('velocity_in_cm_per_s', 0.0))
-
-    return params
-
-
 def create_test_param_file(output_name, enabled_modules=None,
                           module_params=None, first_file=0, last_file=0):
     """
@@ -224,12 +189,10 @@ def create_test_param_file(output_name, enabled_modules=None,
                 config['modules']['parameters'][module_name][param_key] = value
 
     # Write test parameter file as YAML
-    param_path = Path(temp_dir) / f"{output_name}.yaml"
+    param_path = param_dir / f"{output_name}.yaml"
+    header = "#" + "="*77 + "\n# sage_infall Integration Test\n" + "#" + "="*77 + "\n\n"
     with open(param_path, 'w') as f:
-        f.write("#" + "="*77 + "\n")
-        f.write("# sage_infall Integration Test\n")
-        f.write("#" + "="*77 + "\n\n")
-        yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+        f.write(header + yaml.dump(config, default_flow_style=False, sort_keys=False))
 
     return param_path
 
@@ -506,7 +469,7 @@ def main():
     Executes all test cases and reports results.
     Can be run directly or via pytest.
     """
-    global temp_dir, ref_param_file
+    global temp_dir, param_dir, ref_param_file
 
     print("=" * 60)
     print("Integration Test Suite: sage_infall")
@@ -526,6 +489,7 @@ def main():
         return 1
 
     temp_dir = Path(tempfile.mkdtemp(prefix="mimic_sage_infall_test_"))
+    param_dir = scratch_dir(prefix="mimic_sage_infall_test_")
 
     try:
         tests = [
@@ -573,8 +537,9 @@ def main():
 
     finally:
         # Clean up
-        if temp_dir and temp_dir.exists():
-            shutil.rmtree(temp_dir)
+        for path in (temp_dir, param_dir):
+            if path and path.exists():
+                shutil.rmtree(path)
 
 
 if __name__ == "__main__":
@@ -30,6 +30,7 @@ Date: 2025-11-17
 """
 
 import os
+import re
 import sys
 import shutil
 import subprocess
@@ -40,13 +41,32 @@ from pathlib import Path
 REPO_ROOT = Path(__file__).parent.parent.parent.parent
 MIMIC_EXE = REPO_ROOT / "mimic"
 
+# Absolute strings resolved once at import, reused by every spawn
+_REPO_ROOT_STR = str(REPO_ROOT.resolve())
+_MIMIC_EXE_STR = str(MIMIC_EXE.resolve())
+
+# Mimic resolves input paths relative to the repo root; only ask subprocess
+# to chdir when we are not already there (cwd forces the slower fork path)
+_SPAWN_CWD = None if os.getcwd() == _REPO_ROOT_STR else _REPO_ROOT_STR
+
 # Add tests directory to path to import framework
 sys.path.insert(0, str(REPO_ROOT / "tests"))
-from framework import load_binary_halos
+from framework import load_binary_halos_header_only, scratch_dir
 
 # Test state
 temp_dir = None
+param_dir = None  # Parameter files only (RAM-backed where available)
 ref_param_file = None
+_ref_yaml_str = None  # Reference config rendered once per run (see setup())
+
+# Line-anchored hooks for the module block written by yaml.dump
+_ENABLED_RE = re.compile(r'^(  enabled: )\[\]$', re.MULTILINE)
+_PARAMETERS_RE = re.compile(r'^(  parameters:) \{\}$', re.MULTILINE)
+
+# Subprocess timeouts (seconds)
+MIMIC_TIMEOUT = 60        # Multi-module runs through the full pipeline
+FAST_MIMIC_TIMEOUT = 15   # Single-module smoke runs
+QUERY_TIMEOUT = 10        # Module registry query (fails during init)
 
 # ANSI color codes
 RED = '\033[0;31m'
@@ -66,7 +86,7 @@ def get_available_modules():
     import yaml
 
     try:
-        test_param = temp_dir / "_query_modules.yaml"
+        test_param = param_dir / "_query_modules.yaml"
 
         with open(ref_param_file, 'r') as f:
             config = yaml.safe_load(f)
@@ -75,20 +95,14 @@ def get_available_modules():
         config['output']['format'] = 'binary'
 
         with open(test_param, 'w') as f:
-            yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+            f.write(yaml.dump(config, default_flow_style=False, sort_keys=False))
 
-        result = subprocess.run(
-            [str(MIMIC_EXE), str(test_param)],
-            capture_output=True,
-            text=True,
-            timeout=10,
-            cwd=REPO_ROOT  # Run from repo root so relative paths work
-        )
+        _, _, stderr = run_mimic(test_param, timeout=QUERY_TIMEOUT)
 
         # Parse available modules from error output
         available = set()
         in_module_list = False
-        for line in result.stderr.split('\n'):
+        for line in stderr.split('\n'):
             if 'Available modules:' in line:
                 in_module_list = True
                 continue
@@ -105,100 +119,118 @@ def get_available_modules():
         return set()
 
 
-def run_mimic(param_file):
+def run_mimic(param_file, timeout=MIMIC_TIMEOUT):
     """
     Execute Mimic with specified parameter file
 
     Args:
         param_file (Path): Path to parameter file
+        timeout (float): Seconds to wait before giving up on the run
 
     Returns:
         tuple: (returncode, stdout, stderr)
+               On timeout, returncode is -1 and stderr describes the timeout
     """
-    result = subprocess.run(
-        [str(MIMIC_EXE), str(param_file)],
-        capture_output=True,
-        text=True,
-        timeout=60,  # 60 second timeout for integration tests
-        cwd=REPO_ROOT  # Run from repo root so relative paths work
-    )
-    return result.returncode, result.stdout, result.stderr
+    # Keep the call on CPython's posix_spawn() fast path (Python 3.8+): an
+    # absolute executable, no close_fds sweep (Python's own descriptors are
+    # already non-inheritable, PEP 446) and no cwd unless we must chdir.
+    # Output is captured as bytes and decoded once here rather than through
+    # text-mode pipe wrappers.
+    try:
+        result = subprocess.run(
+            [_MIMIC_EXE_STR, os.fspath(param_file)],
+            capture_output=True,
+            timeout=timeout,
+            close_fds=False,
+            cwd=_SPAWN_CWD  # Run from repo root so relative paths work
+        )
+    except subprocess.TimeoutExpired:
+        return -1, "", f"Mimic timed out after {timeout}s (param file: {param_file})"
+    return (result.returncode,
+            result.stdout.decode(errors='replace'),
+            result.stderr.decode(errors='replace'))
+
 
+def _render_reference_yaml():
+    """
+    Render the reference configuration once as YAML text
+
+    The returned text has binary output pointed at the temp directory and an
+    empty module block ("enabled: []" / "parameters: {}") that
+    _inject_overrides() fills in per test.
 
-def read_param_file(param_file):
-    """Read YAML parameter file and return as dictionary."""
+    Returns:
+        str: YAML document for the reference configuration
+    """
     import yaml
 
-    with open(param_file, 'r') as f:
+    with open(ref_param_file, 'r') as f:
         config = yaml.safe_load(f)
 
-    # Flatten hierarchical structure
-    params = {}
-    if 'output' in config:
-        params['OutputFileBaseName'] = config['output'].get('file_base_name', 'model')
-        params['OutputDir'] = config['output'].get('directory', './')
-        params['OutputFormat'] = config['output'].get('format', 'binary')
-    if 'input' in config:
-        params['FirstFile'] = str(config['input'].get('first_file', 0))
-        params['LastFile'] = str(config['input'].get('last_file', 0))
-        params['TreeName'] = config['input'].get('tree_name', '')
-        params['TreeType'] = config['input'].get('tree_type', 'lhalo_binary')
-        params['SimulationDir'] = config['input'].get('simulation_dir', './')
-        params['FileWithSnapList'] = config['input'].get('snapshot_list_file', '')
-        params['LastSnapshotNr'] = str(config['input'].get('last_snapshot', 0))
-    if 'simulation' in config:
-        params['BoxSize'] = str(config['simulation'].get('box_size', 0.0))
-        params['PartMass'] = str(config['simulation'].get('particle_mass', 0.0))
-        if 'cosmology' in config['simulation']:
-            params['Omega'] = str(config['simulation']['cosmology'].get('omega_matter', 0.0))
-            params['OmegaLambda'] = str(config['simulation']['cosmology'].get('omega_lambda', 0.0))
-            params['Hubble_h'] = str(config['simulation']['cosmology'].get('hubble_h', 0.0))
-    if 'units' in config:
-        params['UnitLength_in_cm'] = str(config['units'].get('length_in_cm', 0.0))
-        params['UnitMass_in_g'] = str(config['units'].get('mass_in_g', 0.0))
-        params['UnitVelocity_in_cm_per_s'] = str(config['units'].get('velocity_in_cm_per_s', 0.0))
-    return params
+    # Ensure binary output format and output directory points to temp dir
+    config['output']['format'] = 'binary'
+    config['output']['directory'] = str(temp_dir / "output")
+    config['modules']['enabled'] = []
+    config['modules']['parameters'] = {}
 
+    return yaml.dump(config, default_flow_style=False, sort_keys=False)
 
-def create_test_param_file(output_file, **overrides):
+
+def _inject_overrides(yaml_str, overrides):
     """
-    Create test YAML parameter file with overrides
+    Splice override keys into the pre-rendered reference YAML
+
+    Only the override schema used by these tests is supported:
+    EnabledModules (comma-separated list) and SageModuleName_ParameterName.
 
     Args:
-        output_file (Path): Path to write parameter file
-        **overrides: Parameter overrides (e.g., EnabledModules='sage_reincorporation')
+        yaml_str (str): Output of _render_reference_yaml()
+        overrides (dict): Parameter overrides
+
+    Returns:
+        str: YAML document with overrides applied
     """
     import yaml
 
-    # Use test data parameter file as reference
-    test_ref_file = REPO_ROOT / "tests" / "data" / "test_binary.yaml"
-    with open(test_ref_file, 'r') as f:
-        config = yaml.safe_load(f)
-
-    # Ensure binary output format and output directory points to temp dir
-    config['output']['format'] = 'binary'
-    config['output']['directory'] = str(temp_dir / "output")
-
-    # Apply overrides
+    modules = []
+    module_params = {}
     for key, value in overrides.items():
         if key == 'EnabledModules':
-            # Split comma-separated list and update modules.enabled
             modules = [m.strip() for m in value.split(',')]
-            config['modules']['enabled'] = modules
         elif key.startswith('Sage') and '_' in key:
-            # Module parameter: SageModuleName_ParameterName
             module_name, param_key = key.split('_', 1)
-            if 'parameters' not in config['modules']:
-                config['modules']['parameters'] = {}
-            if module_name not in config['modules']['parameters']:
-                config['modules']['parameters'][module_name] = {}
-            config['modules']['parameters'][module_name][param_key] = value
+            module_params.setdefault(module_name, {})[param_key] = str(value)
         # Add more override handling as needed
 
+    # Values go through the YAML emitter, which quotes and escapes them
+    if modules:
+        enabled = yaml.safe_dump(modules, default_flow_style=True).strip()
+        yaml_str = _ENABLED_RE.sub(
+            lambda m: f"{m.group(1)}{enabled}", yaml_str, count=1
+        )
+    if module_params:
+        block = yaml.safe_dump(module_params, default_flow_style=False,
+                               sort_keys=False)
+        block = "".join("    " + line for line in block.splitlines(True))
+        yaml_str = _PARAMETERS_RE.sub(
+            lambda m: f"{m.group(1)}\n{block.rstrip()}", yaml_str, count=1
+        )
+
+    return yaml_str
+
+
+def create_test_param_file(output_file, **overrides):
+    """
+    Create test YAML parameter file with overrides
+
+    Args:
+        output_file (Path): Path to write parameter file
+        **overrides: Parameter overrides (e.g., EnabledModules='sage_reincorporation')
+    """
     # Write parameter file as YAML
     with open(output_file, 'w') as f:
         f.write("# Test parameter file for sage_reincorporation module\n\n")
-        yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+        f.write(_inject_overrides(_ref_yaml_str, overrides))
 
 
 def check_memory_leaks(stderr):
@@ -223,11 +255,11 @@ def test_module_loads():
         return False
 
     # Create parameter file with sage_reincorporation enabled
-    param_file = temp_dir / "test_module_loads.yaml"
+    param_file = param_dir / "test_module_loads.yaml"
     create_test_param_file(param_file, EnabledModules='sage_reincorporation')
 
     # Run Mimic
-    returncode, stdout, stderr = run_mimic(param_file)
+    returncode, stdout, stderr = run_mimic(param_file, timeout=FAST_MIMIC_TIMEOUT)
 
     if returncode != 0:
         print(f"  {RED}✗ FAIL:{NC} Mimic execution failed")
@@ -243,7 +275,7 @@ def test_parameters_configurable():
     print(f"\n{BLUE}TEST:{NC} Parameters configurable")
 
     # Create parameter file with custom ReIncorporationFactor
-    param_file = temp_dir / "test_parameters.yaml"
+    param_file = param_dir / "test_parameters.yaml"
     create_test_param_file(
         param_file,
         EnabledModules='sage_reincorporation',
@@ -251,7 +283,7 @@ def test_parameters_configurable():
     )
 
     # Run Mimic
-    returncode, stdout, stderr = run_mimic(param_file)
+    returncode, stdout, stderr = run_mimic(param_file, timeout=FAST_MIMIC_TIMEOUT)
 
     if returncode != 0:
         print(f"  {RED}✗ FAIL:{NC} Mimic execution failed with custom parameter")
@@ -272,7 +304,7 @@ def test_memory_safety():
     print(f"\n{BLUE}TEST:{NC} Memory safety (no leaks)")
 
     # Create parameter file
-    param_file = temp_dir / "test_memory.yaml"
+    param_file = param_dir / "test_memory.yaml"
     create_test_param_file(param_file, EnabledModules='sage_reincorporation')
 
     # Run Mimic
@@ -297,7 +329,7 @@ def test_execution_completes():
     print(f"\n{BLUE}TEST:{NC} Full execution completes")
 
     # Create parameter file
-    param_file = temp_dir / "test_execution.yaml"
+    param_file = param_dir / "test_execution.yaml"
     create_test_param_file(param_file, EnabledModules='sage_reincorporation')
 
     # Run Mimic
@@ -331,7 +363,7 @@ def test_multi_module_pipeline():
         return True  # Skip, not a failure
 
     # Create parameter file with sage_infall + sage_reincorporation
-    param_file = temp_dir / "test_multi_module.yaml"
+    param_file = param_dir / "test_multi_module.yaml"
     create_test_param_file(
         param_file,
         EnabledModules='sage_infall,sage_reincorporation',
@@ -363,7 +395,7 @@ def test_property_modification():
         return True  # Skip, not a failure
 
     # Create parameter file with modules that populate ejected reservoir
-    param_file = temp_dir / "test_properties.yaml"
+    param_file = param_dir / "test_properties.yaml"
     create_test_param_file(
         param_file,
         EnabledModules='sage_infall,sage_reincorporation',
@@ -386,9 +418,9 @@ def test_property_modification():
         print(f"  {RED}✗ FAIL:{NC} No output files created")
         return False
 
-    # Read first output file
+    # Map first output file (only the dtype is inspected, no halo data read)
     try:
-        halos, metadata = load_binary_halos(output_files[0])
+        halos, metadata = load_binary_halos_header_only(output_files[0])
 
         # Check that required properties exist
         required_props = ['EjectedMass', 'HotGas', 'MetalsEjectedMass', 'MetalsHotGas']
@@ -414,17 +446,18 @@ def test_critical_velocity_threshold():
     # We can't easily control halo Vvir from parameter file,
     # but we can verify execution doesn't crash with various parameters
 
-    param_file = temp_dir / "test_vcrit.yaml"
+    param_file = param_dir / "test_vcrit.yaml"
     create_test_param_file(
         param_file,
         EnabledModules='sage_reincorporation',
         SageReincorporation_ReIncorporationFactor='2.0'  # Higher threshold
     )
 
-    returncode, stdout, stderr = run_mimic(param_file)
+    returncode, stdout, stderr = run_mimic(param_file, timeout=FAST_MIMIC_TIMEOUT)
 
     if returncode != 0:
         print(f"  {RED}✗ FAIL:{NC} Execution failed with ReIncorporationFactor=2.0")
+        print(f"        stderr: {stderr[:200]}")
         return False
 
     print(f"  {GREEN}✓ PASS:{NC} Module handles different critical velocity thresholds")
@@ -435,10 +468,12 @@ def test_critical_velocity_threshold():
 
 def setup():
     """Set up test environment"""
-    global temp_dir, ref_param_file
+    global temp_dir, param_dir, ref_param_file, _ref_yaml_str
 
-    # Create temporary directory for test outputs
+    # Create temporary directories: outputs on the normal temp path,
+    # parameter files in RAM-backed storage where available
     temp_dir = Path(tempfile.mkdtemp(prefix="mimic_test_sage_reincorporation_"))
+    param_dir = scratch_dir(prefix="mimic_test_sage_reincorporation_")
 
     # Create output directory
     output_dir = temp_dir / "output"
@@ -453,6 +488,9 @@ def setup():
     if not MIMIC_EXE.exists():
         raise FileNotFoundError(f"Mimic executable not found: {MIMIC_EXE}")
 
+    # Render the reference configuration once; tests only splice overrides
+    _ref_yaml_str = _render_reference_yaml()
+
     print(f"{BLUE}Setup:{NC} Test directory: {temp_dir}")
     print(f"{BLUE}Setup:{NC} Output directory: {output_dir}")
     print(f"{BLUE}Setup:{NC} Reference param file: {ref_param_file}")
@@ -460,8 +498,10 @@ def setup():
 
 def teardown():
     """Clean up test environment"""
-    global temp_dir
+    global temp_dir, param_dir
 
+    if param_dir and param_dir.exists():
+        shutil.rmtree(param_dir)
     if temp_dir and temp_dir.exists():
         shutil.rmtree(temp_dir)
         print(f"\n{BLUE}Cleanup:{NC} Removed test directory: {temp_dir}")
@@ -31,19 +31,20 @@ Author: Mimic Development Team
 Date: 2025-11-17
 """
 
-import unittest
+import sys
 
+DEFERRED_REASON = (
+    "Physics validation deferred until sage_starformation_feedback "
+    "is implemented to populate ejected reservoir"
+)
 
-class TestSageReincorporationValidation(unittest.TestCase):
-    """Scientific validation tests - deferred until dependencies complete."""
-
-    def test_deferred_placeholder(self):
-        """Placeholder test - validation deferred until dependencies complete"""
-        self.skipTest(
-            "Physics validation deferred until sage_starformation_feedback "
-            "is implemented to populate ejected reservoir"
-        )
+if __name__ == '__main__':
+    # Standalone run (make test-scientific): report the deferral and exit cleanly
+    print(f"SKIPPED: {DEFERRED_REASON}")
+    sys.exit(0)
 
+# Under pytest, skip the whole module at collection time so no test
+# class is instantiated or scheduled
+import pytest
 
-if __name__ == '__main__':
-    unittest.main(verbosity=2)
+pytest.skip(DEFERRED_REASON, allow_module_level=True)
@@ -2,41 +2,70 @@
 Test Framework for Mimic
 
 Shared utilities for testing Mimic functionality.
+
+Submodules are imported lazily (PEP 562): harness helpers do not pull in
+numpy via data_loader, so tests that never read halo data start faster.
 """
 
-from .data_loader import (
-    load_binary_halos,
-    get_halo_dtype,
-    validate_no_nans,
-    validate_no_infs,
-    validate_range,
-)
+import importlib
+import sys
+import warnings
 
-from .harness import (
-    REPO_ROOT,
-    TEST_DATA_DIR,
-    MIMIC_EXE,
-    ensure_output_dirs,
-    run_mimic,
-    read_param_file,
-    create_test_param_file,
-    check_no_memory_leaks,
-)
+# The package must be imported under one name only. Importing it as both
+# "framework" (tests/ on sys.path) and "tests.framework" (repo root on
+# sys.path) creates two copies of every submodule, each with its own caches.
+for _alias in ('framework', 'tests.framework'):
+    if _alias != __name__ and _alias in sys.modules:
+        warnings.warn(
+            f"Mimic test framework imported as both {_alias!r} and {__name__!r}; "
+            f"import it as 'framework' only",
+            ImportWarning,
+            stacklevel=2,
+        )
+del _alias
 
-__all__ = [
+# Public name -> submodule that defines it
+_DATA_LOADER = (
     # Data loading and validation
     'load_binary_halos',
+    'load_binary_halos_header_only',
     'get_halo_dtype',
     'validate_no_nans',
     'validate_no_infs',
     'validate_range',
+)
+
+_HARNESS = (
     # Test harness utilities
     'REPO_ROOT',
     'TEST_DATA_DIR',
     'MIMIC_EXE',
     'ensure_output_dirs',
+    'scratch_dir',
     'run_mimic',
+    'run_mimic_batch',
     'read_param_file',
     'create_test_param_file',
+    'find_memory_leak',
     'check_no_memory_leaks',
-]
+)
+
+_SUBMODULE_FOR = {
+    **{name: 'data_loader' for name in _DATA_LOADER},
+    **{name: 'harness' for name in _HARNESS},
+}
+
+__all__ = [*_DATA_LOADER, *_HARNESS]
+
+
+def __getattr__(name):
+    submodule = _SUBMODULE_FOR.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{submodule}", __name__), name)
+    globals()[name] = value  # Cache so later lookups bypass __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -39,6 +39,71 @@ def get_halo_dtype():
     return get_binary_dtype()
 
 
+def _read_binary_header(f, file_path):
+    """
+    Read and validate the header of a Mimic binary output file.
+
+    Args:
+        f: Binary file object positioned at the start of the file
+        file_path (Path): Path to the file (for metadata)
+
+    Returns:
+        tuple: (header_size, metadata)
+            header_size: Size of the header in bytes (offset of halo data)
+            metadata: Dictionary with file metadata (Ntrees, TotHalos, etc.)
+
+    Raises:
+        ValueError: If header is invalid
+    """
+    # Read header
+    Ntrees = np.fromfile(f, np.int32, 1)[0]
+    TotHalos = np.fromfile(f, np.int32, 1)[0]
+
+    # Validate header
+    if Ntrees < 0 or Ntrees > 1000000:
+        raise ValueError(f"Invalid Ntrees value: {Ntrees}")
+    if TotHalos < 0 or TotHalos > 100000000:
+        raise ValueError(f"Invalid TotHalos value: {TotHalos}")
+
+    # Read halos per tree array
+    halos_per_tree = np.fromfile(f, np.int32, Ntrees)
+
+    # Validate consistency
+    sum_halos = np.sum(halos_per_tree)
+    if sum_halos != TotHalos:
+        raise ValueError(
+            f"Inconsistent header: sum of halos per tree ({sum_halos}) "
+            f"!= TotHalos ({TotHalos})"
+        )
+
+    # Create metadata dictionary
+    metadata = {
+        'Ntrees': Ntrees,
+        'TotHalos': TotHalos,
+        'halos_per_tree': halos_per_tree,
+        'file_path': str(file_path),
+    }
+
+    header_size = np.dtype(np.int32).itemsize * (2 + int(Ntrees))
+
+    return header_size, metadata
+
+
+def _check_binary_file(file_path):
+    """
+    Check that a binary output file exists and is non-empty.
+
+    Raises:
+        FileNotFoundError: If file doesn't exist
+        ValueError: If file is empty
+    """
+    if not file_path.exists():
+        raise FileNotFoundError(f"Binary file not found: {file_path}")
+
+    if file_path.stat().st_size == 0:
+        raise ValueError(f"Binary file is empty: {file_path}")
+
+
 def load_binary_halos(file_path):
     """
     Load halos from a Mimic binary output file.
@@ -56,38 +121,15 @@ def load_binary_halos(file_path):
         ValueError: If file format is invalid
     """
     file_path = Path(file_path)
-
-    if not file_path.exists():
-        raise FileNotFoundError(f"Binary file not found: {file_path}")
-
-    if file_path.stat().st_size == 0:
-        raise ValueError(f"Binary file is empty: {file_path}")
+    _check_binary_file(file_path)
 
     # Get halo dtype
     dtype = get_halo_dtype()
 
     # Read file
     with open(file_path, 'rb') as f:
-        # Read header
-        Ntrees = np.fromfile(f, np.int32, 1)[0]
-        TotHalos = np.fromfile(f, np.int32, 1)[0]
-
-        # Validate header
-        if Ntrees < 0 or Ntrees > 1000000:
-            raise ValueError(f"Invalid Ntrees value: {Ntrees}")
-        if TotHalos < 0 or TotHalos > 100000000:
-            raise ValueError(f"Invalid TotHalos value: {TotHalos}")
-
-        # Read halos per tree array
-        halos_per_tree = np.fromfile(f, np.int32, Ntrees)
-
-        # Validate consistency
-        sum_halos = np.sum(halos_per_tree)
-        if sum_halos != TotHalos:
-            raise ValueError(
-                f"Inconsistent header: sum of halos per tree ({sum_halos}) "
-                f"!= TotHalos ({TotHalos})"
-            )
+        _, metadata = _read_binary_header(f, file_path)
+        TotHalos = metadata['TotHalos']
 
         # Read halo data
         halos = np.fromfile(f, dtype, TotHalos)
@@ -101,13 +143,51 @@ def load_binary_halos(file_path):
     # Convert to recarray for attribute access
     halos = halos.view(np.recarray)
 
-    # Create metadata dictionary
-    metadata = {
-        'Ntrees': Ntrees,
-        'TotHalos': TotHalos,
-        'halos_per_tree': halos_per_tree,
-        'file_path': str(file_path),
-    }
+    return halos, metadata
+
+
+def load_binary_halos_header_only(file_path):
+    """
+    Memory-map halos from a Mimic binary output file without reading them.
+
+    Only the header is read from disk. Halo data pages are loaded lazily when
+    indexed, so checks that only need the dtype (e.g. property names) touch
+    no halo data at all.
+
+    Args:
+        file_path (str or Path): Path to binary output file
+
+    Returns:
+        tuple: (halos, metadata)
+            halos: Read-only NumPy memmap over the halo records
+            metadata: Dictionary with file metadata (Ntrees, TotHalos, etc.)
+
+    Raises:
+        FileNotFoundError: If file doesn't exist
+        ValueError: If file format is invalid
+    """
+    file_path = Path(file_path)
+    _check_binary_file(file_path)
+
+    dtype = get_halo_dtype()
+
+    with open(file_path, 'rb') as f:
+        header_size, metadata = _read_binary_header(f, file_path)
+
+    TotHalos = metadata['TotHalos']
+    expected_size = header_size + TotHalos * dtype.itemsize
+    if file_path.stat().st_size < expected_size:
+        raise ValueError(
+            f"Expected {TotHalos} halos ({expected_size} bytes), but file is "
+            f"only {file_path.stat().st_size} bytes"
+        )
+
+    if TotHalos == 0:
+        # np.memmap cannot map a zero-length region
+        return np.empty(0, dtype=dtype), metadata
+
+    halos = np.memmap(file_path, dtype=dtype, mode='r',
+                      offset=header_size, shape=(int(TotHalos),))
 
     return halos, metadata
 
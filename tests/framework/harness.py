@@ -9,16 +9,116 @@ Author: Mimic Testing Team
 Date: 2025-11-13
 """
 
+import contextlib
+import functools
+import json
+import mmap
 import os
+import re
+import signal
 import subprocess
+import sys
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import yaml
+
 
 # Repository paths
 REPO_ROOT = Path(__file__).parent.parent.parent
 TEST_DATA_DIR = REPO_ROOT / "tests" / "data"
 MIMIC_EXE = REPO_ROOT / "mimic"
+_REPO_ROOT_STR = os.fspath(REPO_ROOT)
+_MIMIC_EXE_STR = os.fspath(MIMIC_EXE)
+
+# Output directories named by the test parameter files, as plain strings
+_OUTPUT_DIRS = tuple(os.path.join(TEST_DATA_DIR, "output", fmt)
+                     for fmt in ("binary", "hdf5"))
+
+# ANSI colors only for an interactive terminal (https://no-color.org)
+_USE_COLOR = sys.stdout.isatty() and os.environ.get("NO_COLOR") is None
+
+
+def _yellow(s):
+    return f"\033[1;33m{s}\033[0m" if _USE_COLOR else s
+
+
+def _red(s):
+    return f"\033[0;31m{s}\033[0m" if _USE_COLOR else s
+
+
+# A log line reporting a leak: mentions "memory leak" at WARNING, ERROR or
+# FATAL level, and is not the "No memory leaks detected" success message
+_LEAK_RE = re.compile(
+    rb"(?im)^(?!.*no memory leak)(?=.*(?:warning|error|fatal)).*memory leak.*$")
+
+# check_memory_leaks() reports at shutdown, so a leak report is normally in
+# a log's last few KB
+_LOG_TAIL_BYTES = 8192
+
+# libyaml-backed loader and dumper when PyYAML was built with it (same safe
+# subset as the pure-Python classes)
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_Dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Banner written at the top of generated test parameter files
+_RULE = "#" + "=" * 77 + "\n"
+PARAM_FILE_HEADER = (
+    _RULE
+    + "# Mimic Test Configuration\n"
+    + _RULE
+    + "# Auto-generated test parameter file\n"
+    + _RULE
+    + "\n"
+)
+
+
+def _ensure_dir(path_str):
+    """
+    Create a directory (and parents) if it does not exist
+
+    Not memoized: a directory removed mid-session (make test-clean, a test
+    that clears its output) is created again on the next call. When the
+    directory exists this is a single stat.
+    """
+    if not os.path.isdir(path_str):
+        os.makedirs(path_str, exist_ok=True)
+
+
+@functools.lru_cache(maxsize=1)
+def _scratch_root():
+    """
+    Parent directory for temporary test directories
+
+    A RAM-backed location (XDG_RUNTIME_DIR, then /dev/shm) when writable, so
+    small parameter files and captured streams never wait on disk. An
+    explicit TMPDIR is respected; None means tempfile's default.
+    """
+    if os.environ.get("TMPDIR"):
+        return None
+    for candidate in (os.environ.get("XDG_RUNTIME_DIR"), "/dev/shm"):
+        if candidate and os.path.isdir(candidate) and \
+                os.access(candidate, os.W_OK | os.X_OK):
+            return candidate
+    return None
+
+
+def scratch_dir(prefix="mimic_"):
+    """
+    Create a temporary directory for small scratch files
+
+    Made in RAM-backed storage when available (see _scratch_root()), for
+    parameter files and similar. Mimic output trees belong under the normal
+    temp path instead, as they can fill a small tmpfs. The caller removes
+    the directory when done.
+
+    Usage:
+        param_dir = scratch_dir()
+        param_file, output_dir, temp_dir = create_test_param_file(
+            "run", param_dir=param_dir)
+    """
+    return Path(tempfile.mkdtemp(prefix=prefix, dir=_scratch_root()))
 
 
 def ensure_output_dirs():
@@ -31,45 +131,266 @@ def ensure_output_dirs():
     Usage:
         ensure_output_dirs()  # Call once at module level or in setUpClass
     """
-    (TEST_DATA_DIR / "output" / "binary").mkdir(parents=True, exist_ok=True)
-    (TEST_DATA_DIR / "output" / "hdf5").mkdir(parents=True, exist_ok=True)
+    for path_str in _OUTPUT_DIRS:
+        _ensure_dir(path_str)
+
 
+@functools.lru_cache(maxsize=1)
+def _mimic_exe_path():
+    """
+    Path to the Mimic executable, checked for existence once per process
 
-def run_mimic(param_file, cwd=None):
+    A failed check raises and is not cached, so building Mimic mid-session
+    is picked up by the next call.
+    """
+    if not MIMIC_EXE.exists():
+        raise FileNotFoundError(
+            f"Mimic executable not found at {MIMIC_EXE}. "
+            f"Build it first with: make"
+        )
+    return _MIMIC_EXE_STR
+
+
+def _run_result(returncode, stdout, stderr, capture, text):
+    """(returncode, stdout, stderr) from raw bytes, as run_mimic() returns it"""
+    if not capture:
+        stdout = stderr = b""
+    if text:
+        return (returncode, stdout.decode(errors='replace'),
+                stderr.decode(errors='replace'))
+    return returncode, stdout, stderr
+
+
+def _kill_process_group(proc, grace=5):
+    """
+    Terminate a process started with start_new_session=True and its children
+
+    Sends SIGTERM to the group, then SIGKILL if it has not exited after
+    grace seconds.
+    """
+    for sig in (signal.SIGTERM, signal.SIGKILL):
+        try:
+            os.killpg(proc.pid, sig)
+        except ProcessLookupError:
+            break
+        try:
+            proc.wait(timeout=grace)
+            break
+        except subprocess.TimeoutExpired:
+            continue
+
+
+def _run_in_group(args, cwd, stdout, stderr, timeout):
+    """
+    Run a command in its own process group and return its exit status
+
+    If the run times out or the caller is interrupted (Ctrl-C, xdist tearing
+    down a worker), the whole group is terminated before the exception
+    propagates, so no orphaned Mimic keeps burning CPU.
+    """
+    proc = subprocess.Popen(args, cwd=cwd, close_fds=False, stdout=stdout,
+                            stderr=stderr, start_new_session=True)
+    try:
+        return proc.wait(timeout=timeout)
+    except BaseException:
+        _kill_process_group(proc)
+        raise
+
+
+def run_mimic(param_file, cwd=None, timeout=None, capture=True, text=True,
+              capture_stdout=True):
     """
     Execute Mimic with specified parameter file
 
     Args:
         param_file (str or Path): Path to parameter file
         cwd (str or Path): Working directory for execution (default: repo root)
+        timeout (float): Seconds before the run is abandoned (default: no limit)
+        capture (bool): Capture stdout/stderr (default: True). Pass False when
+                        only the return code or on-disk output is checked; both
+                        streams then go to /dev/null and are returned empty
+        text (bool): Decode stdout/stderr to str (default: True). Pass False
+                     to get the raw bytes and skip decoding, e.g. when the
+                     streams are only searched with bytes patterns
+        capture_stdout (bool): With capture, also capture stdout (default:
+                               True). Pass False when only stderr is
+                               checked; stdout (Mimic's INFO log) then goes
+                               to /dev/null and is returned empty
 
     Returns:
         tuple: (returncode, stdout, stderr)
 
+    Mimic runs in its own session (process group), which is killed on
+    timeout or interruption. A new session rules out CPython's posix_spawn
+    fast path, so each run is a fork/exec.
+
     Raises:
         FileNotFoundError: If Mimic executable not found
+        subprocess.TimeoutExpired: If timeout is given and exceeded
 
     Usage:
         returncode, stdout, stderr = run_mimic("input/millennium.yaml")
         assert returncode == 0, f"Mimic failed: {stderr}"
     """
-    if cwd is None:
-        cwd = REPO_ROOT
+    # Plain strings for subprocess (os.fspath returns a str argument as is)
+    cwd = _REPO_ROOT_STR if cwd is None else os.fspath(cwd)
+    param_arg = os.fspath(param_file)
+
+    mimic_exe = _mimic_exe_path()
+
+    # Streams are read as bytes; decoding (if any) happens once, at the end.
+    # Captured streams go to anonymous temporary files (in RAM-backed
+    # storage when available) rather than pipes: the child writes straight
+    # to the file and nothing in Python has to drain it while Mimic runs
+    if capture:
+        with (tempfile.TemporaryFile(dir=_scratch_root()) if capture_stdout
+              else contextlib.nullcontext()) as out, \
+                tempfile.TemporaryFile(dir=_scratch_root()) as err:
+            returncode = _run_in_group(
+                [mimic_exe, param_arg], cwd,
+                subprocess.DEVNULL if out is None else out, err, timeout)
+            stdout = b""
+            if out is not None:
+                out.seek(0)
+                stdout = out.read()
+            err.seek(0)
+            stderr = err.read()
+    else:
+        returncode = _run_in_group([mimic_exe, param_arg], cwd,
+                                   subprocess.DEVNULL, subprocess.DEVNULL,
+                                   timeout)
+        stdout = stderr = b""
 
-    if not MIMIC_EXE.exists():
-        raise FileNotFoundError(
-            f"Mimic executable not found at {MIMIC_EXE}. "
-            f"Build it first with: make"
-        )
+    return _run_result(returncode, stdout, stderr, capture, text)
+
+
+def run_mimic_batch(param_files, cwd=None, timeout=None, capture=True,
+                    max_workers=None, text=True, capture_stdout=True):
+    """
+    Execute Mimic once per parameter file, overlapping the runs
+
+    Mimic has no multi-run (batch) mode, so each file still gets its own
+    process; the independent runs are dispatched through a thread pool so
+    their start-up and execution overlap.
+
+    Args:
+        param_files (iterable): Parameter file paths
+        cwd, timeout, capture, text, capture_stdout: As for run_mimic()
+        max_workers (int): Concurrent runs (default: min(len, cpu_count))
+
+    Returns:
+        list: (returncode, stdout, stderr) per parameter file, in input order
 
-    result = subprocess.run(
-        [str(MIMIC_EXE), str(param_file)],
-        cwd=str(cwd),
-        capture_output=True,
-        text=True
-    )
+    Usage:
+        results = run_mimic_batch([param_a, param_b])
+        for returncode, stdout, stderr in results:
+            assert returncode == 0, stderr
+    """
+    param_files = list(param_files)
+    if not param_files:
+        return []
+    if max_workers is None:
+        max_workers = min(len(param_files), os.cpu_count() or 1)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(
+            lambda param_file: run_mimic(param_file, cwd=cwd, timeout=timeout,
+                                         capture=capture, text=text,
+                                         capture_stdout=capture_stdout),
+            param_files))
+
+
+@functools.lru_cache(maxsize=8)
+def _load_yaml_cached(path_str, mtime_ns):
+    """
+    Parse a YAML parameter file, memoized on (path, mtime)
+
+    Callers must not mutate the returned object; use _load_config() for a
+    private copy. Keying on mtime means an edited file is re-read.
+
+    The file is read in one call and the buffer handed to the loader, which
+    then scans it in a single pass instead of refilling from the stream.
+    """
+    with open(path_str, 'rb') as f:
+        data = f.read()
+    return yaml.load(data, Loader=_Loader)
+
+
+def _copy_config(node):
+    """
+    Deep-copy a parsed YAML document
+
+    A safe-loaded document is only dicts, lists (and the rare !!set) of
+    immutable scalars, so only the containers need copying; this avoids
+    copy.deepcopy()'s memo bookkeeping.
+    """
+    if isinstance(node, dict):
+        return {key: _copy_config(value) for key, value in node.items()}
+    if isinstance(node, list):
+        return [_copy_config(value) for value in node]
+    if isinstance(node, set):
+        return set(node)  # !!set members are hashable, hence immutable
+    return node
+
+
+def _load_config(param_file):
+    """Return a private (deep) copy of the parsed YAML parameter file"""
+    param_file = Path(param_file)
+    return _copy_config(
+        _load_yaml_cached(str(param_file), param_file.stat().st_mtime_ns))
+
+
+# read_param_file() keys: (name, YAML path, default, converter). A key is
+# present only when every section on its path is; a converter of None keeps
+# the YAML value as parsed
+_PARAM_SPEC = (
+    ('OutputDir', ('output', 'directory'), './', None),
+    ('OutputFileBaseName', ('output', 'file_base_name'), 'model', None),
+    ('OutputFormat', ('output', 'format'), 'binary', None),
+    ('FirstFile', ('input', 'first_file'), 0, str),
+    ('LastFile', ('input', 'last_file'), 0, str),
+    ('TreeName', ('input', 'tree_name'), '', None),
+    ('TreeType', ('input', 'tree_type'), 'lhalo_binary', None),
+    ('SimulationDir', ('input', 'simulation_dir'), './', None),
+    ('FileWithSnapList', ('input', 'snapshot_list_file'), '', None),
+    ('LastSnapshotNr', ('input', 'last_snapshot'), 0, str),
+    ('BoxSize', ('simulation', 'box_size'), 0.0, str),
+    ('PartMass', ('simulation', 'particle_mass'), 0.0, str),
+    ('Omega', ('simulation', 'cosmology', 'omega_matter'), 0.0, str),
+    ('OmegaLambda', ('simulation', 'cosmology', 'omega_lambda'), 0.0, str),
+    ('Hubble_h', ('simulation', 'cosmology', 'hubble_h'), 0.0, str),
+    ('UnitLength_in_cm', ('units', 'length_in_cm'), 0.0, str),
+    ('UnitMass_in_g', ('units', 'mass_in_g'), 0.0, str),
+    ('UnitVelocity_in_cm_per_s', ('units', 'velocity_in_cm_per_s'), 0.0, str),
+)
+
+_MISSING = object()
+
+
+def _lookup(config, path, default):
+    """
+    Value at a YAML path in a parsed parameter file
+
+    Returns default when only the leaf key is absent, _MISSING when one of
+    the sections leading to it is.
+    """
+    node = config
+    for key in path[:-1]:
+        node = node.get(key)
+        if node is None:
+            return _MISSING
+    return node.get(path[-1], default)
 
-    return result.returncode, result.stdout, result.stderr
+
+@functools.lru_cache(maxsize=8)
+def _read_param_file_cached(path_str, mtime_ns):
+    """Flattened parameters for read_param_file(), memoized on (path, mtime)"""
+    config = _load_yaml_cached(path_str, mtime_ns)
+    return {
+        name: value if conv is None else conv(value)
+        for name, path, default, conv in _PARAM_SPEC
+        if (value := _lookup(config, path, default)) is not _MISSING
+    }
 
 
 def read_param_file(param_file):
@@ -77,6 +398,7 @@ def read_param_file(param_file):
     Read YAML parameter file and return as dictionary
 
     Parses a Mimic YAML parameter file and returns key-value pairs.
+    The parse is cached per (path, mtime); each call returns a fresh dict.
 
     Args:
         param_file (str or Path): Path to YAML parameter file
@@ -89,45 +411,87 @@ def read_param_file(param_file):
         output_dir = params['OutputDir']
         hubble_h = float(params['Hubble_h'])
     """
-    import yaml
-
     param_file = Path(param_file)
+    return dict(_read_param_file_cached(str(param_file), param_file.stat().st_mtime_ns))
+
+
+# Strings that float() accepts (surrounding whitespace, inf and nan included)
+_NUMBER_RE = re.compile(
+    r"\s*[+-]?(?:(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?|inf(?:inity)?|nan)\s*",
+    re.IGNORECASE)
+
+
+def _coerce(value):
+    """
+    Convert a module parameter value to the type written to YAML
+
+    Numbers and numeric strings become int when integral, float otherwise;
+    anything else is kept as given. Dispatches on type and a regex match
+    rather than catching float()'s exceptions.
+    """
+    if isinstance(value, str):
+        if _NUMBER_RE.fullmatch(value) is None:
+            return value  # Keep as string
+        value = float(value)
+    elif isinstance(value, (int, float)):
+        value = float(value)
+    else:
+        return value
+    return int(value) if value.is_integer() else value
+
+
+# Placeholders in the cached rendering of a reference parameter file
+_TEMPLATE_OUTPUT_DIR = "__OUTPUT_DIR__"
+_TEMPLATE_FIRST_FILE = "__FIRST_FILE__"
+_TEMPLATE_LAST_FILE = "__LAST_FILE__"
+_TEMPLATE_MODULES = "modules: __MODULES_BLOCK__\n"
 
-    with open(param_file, 'r') as f:
-        config = yaml.safe_load(f)
-
-    # Flatten hierarchical structure
-    params = {}
-    if 'output' in config:
-        params['OutputDir'] = config['output'].get('directory', './')
-        params['OutputFileBaseName'] = config['output'].get('file_base_name', 'model')
-        params['OutputFormat'] = config['output'].get('format', 'binary')
-    if 'input' in config:
-        params['FirstFile'] = str(config['input'].get('first_file', 0))
-        params['LastFile'] = str(config['input'].get('last_file', 0))
-        params['TreeName'] = config['input'].get('tree_name', '')
-        params['TreeType'] = config['input'].get('tree_type', 'lhalo_binary')
-        params['SimulationDir'] = config['input'].get('simulation_dir', './')
-        params['FileWithSnapList'] = config['input'].get('snapshot_list_file', '')
-        params['LastSnapshotNr'] = str(config['input'].get('last_snapshot', 0))
-    if 'simulation' in config:
-        params['BoxSize'] = str(config['simulation'].get('box_size', 0.0))
-        params['PartMass'] = str(config['simulation'].get('particle_mass', 0.0))
-        if 'cosmology' in config['simulation']:
-            params['Omega'] = str(config['simulation']['cosmology'].get('omega_matter', 0.0))
-            params['OmegaLambda'] = str(config['simulation']['cosmology'].get('omega_lambda', 0.0))
-            params['Hubble_h'] = str(config['simulation']['cosmology'].get('hubble_h', 0.0))
-    if 'units' in config:
-        params['UnitLength_in_cm'] = str(config['units'].get('length_in_cm', 0.0))
-        params['UnitMass_in_g'] = str(config['units'].get('mass_in_g', 0.0))
-        params['UnitVelocity_in_cm_per_s'] = str(config['units'].get('velocity_in_cm_per_s', 0.0))
-
-    return params
+# Generated files are assembled and written as UTF-8 bytes
+_PARAM_FILE_HEADER_BYTES = PARAM_FILE_HEADER.encode()
+
+# Modules section of a physics-free run (as yaml.dump would render it)
+_PHYSICS_FREE_MODULES_BLOCK = b"modules:\n  enabled: []\n  parameters: {}\n"
+
+# Splits a rendered template into literal text and (captured) placeholders
+_TEMPLATE_SLOT_RE = re.compile(b"(" + b"|".join(
+    re.escape(placeholder.encode()) for placeholder in (
+        _TEMPLATE_OUTPUT_DIR, _TEMPLATE_FIRST_FILE, _TEMPLATE_LAST_FILE,
+        _TEMPLATE_MODULES)) + b")")
+
+
+@functools.lru_cache(maxsize=8)
+def _param_file_template(path_str, mtime_ns):
+    """
+    Render a reference parameter file once, split around placeholders
+
+    The output directory, file range and the whole modules section are the
+    only parts create_test_param_file() changes; they are rendered as the
+    _TEMPLATE_* placeholders and the text cut at each one. Returns a tuple
+    of UTF-8 byte strings, header included: literal text at even indices,
+    the placeholder (as bytes) at odd ones, ready for _render_param_file().
+    """
+    config = _copy_config(_load_yaml_cached(path_str, mtime_ns))
+    config['output']['directory'] = _TEMPLATE_OUTPUT_DIR
+    config['input']['first_file'] = _TEMPLATE_FIRST_FILE
+    config['input']['last_file'] = _TEMPLATE_LAST_FILE
+    config['modules'] = _TEMPLATE_MODULES.split(": ", 1)[1].rstrip()
+
+    rendered = _PARAM_FILE_HEADER_BYTES + yaml.dump(
+        config, Dumper=_Dumper, default_flow_style=False, sort_keys=False,
+        encoding='utf-8')
+    return tuple(_TEMPLATE_SLOT_RE.split(rendered))
+
+
+def _render_param_file(template, values):
+    """Join a split template, filling each placeholder from values (bytes -> bytes)"""
+    return b"".join(values[part] if i % 2 else part
+                    for i, part in enumerate(template))
 
 
 def create_test_param_file(output_name, enabled_modules=None,
                             module_params=None, first_file=0, last_file=0,
-                            ref_param_file=None, temp_dir=None):
+                            ref_param_file=None, temp_dir=None,
+                            param_dir=None):
     """
     Create a test YAML parameter file with specified module configuration
 
@@ -141,7 +505,10 @@ def create_test_param_file(output_name, enabled_modules=None,
         first_file (int): First file to process (default: 0)
         last_file (int): Last file to process (default: 0)
         ref_param_file (str or Path): Reference YAML parameter file (default: millennium.yaml)
-        temp_dir (str or Path): Temporary directory for outputs (default: create new)
+        temp_dir (str or Path): Temporary directory for outputs (default:
+                                create new, under tempfile.gettempdir())
+        param_dir (str or Path): Directory for the parameter file itself
+                                 (default: temp_dir), e.g. from scratch_dir()
 
     Returns:
         tuple: (param_file_path, output_dir_path, temp_dir_path)
@@ -169,67 +536,125 @@ def create_test_param_file(output_name, enabled_modules=None,
         import shutil
         shutil.rmtree(temp_dir)
     """
-    import yaml
-
     # Set defaults
     if ref_param_file is None:
         ref_param_file = REPO_ROOT / "input" / "millennium.yaml"
     if temp_dir is None:
         temp_dir = tempfile.mkdtemp(prefix="mimic_test_")
-    else:
-        temp_dir = Path(temp_dir)
+    temp_dir = Path(temp_dir)
 
-    # Read reference parameter file (YAML)
-    with open(ref_param_file, 'r') as f:
-        config = yaml.safe_load(f)
+    # Reference parameter file, parsed and rendered once per (path, mtime)
+    ref_param_file = Path(ref_param_file)
+    cache_key = (str(ref_param_file), ref_param_file.stat().st_mtime_ns)
+    template = _param_file_template(*cache_key)
 
     # Create output directory
-    output_dir = Path(temp_dir) / output_name
-    output_dir.mkdir(parents=True, exist_ok=True)
+    output_dir = temp_dir / output_name
+    _ensure_dir(str(output_dir))
 
-    # Update configuration
-    config['output']['directory'] = str(output_dir)
-    config['input']['first_file'] = first_file
-    config['input']['last_file'] = last_file
-
-    # Update module configuration
+    # Update module configuration (the only part still dumped per call)
     if enabled_modules:
-        config['modules']['enabled'] = enabled_modules
+        modules = _copy_config(_load_yaml_cached(*cache_key).get('modules') or {})
+        modules['enabled'] = enabled_modules
 
         # Parse and add module parameters
         if module_params:
-            if 'parameters' not in config['modules']:
-                config['modules']['parameters'] = {}
+            if 'parameters' not in modules:
+                modules['parameters'] = {}
 
             for param_name, value in module_params.items():
                 # Parse ModuleName_ParameterName format
                 if '_' in param_name:
                     module_name, param_key = param_name.split('_', 1)
-                    if module_name not in config['modules']['parameters']:
-                        config['modules']['parameters'][module_name] = {}
-                    # Try to convert to appropriate type
-                    try:
-                        value = float(value)
-                        if value.is_integer():
-                            value = int(value)
-                    except (ValueError, AttributeError):
-                        pass  # Keep as string
-                    config['modules']['parameters'][module_name][param_key] = value
+                    if module_name not in modules['parameters']:
+                        modules['parameters'][module_name] = {}
+                    modules['parameters'][module_name][param_key] = _coerce(value)
+
+        modules_block = yaml.dump({'modules': modules}, Dumper=_Dumper,
+                                  default_flow_style=False, sort_keys=False,
+                                  encoding='utf-8')
     else:
-        config['modules']['enabled'] = []
-        config['modules']['parameters'] = {}
+        # Physics-free: fixed text, no YAML emitter involved at all
+        modules_block = _PHYSICS_FREE_MODULES_BLOCK
+
+    # Fill the template's slots in one join (JSON scalars are valid YAML
+    # flow scalars, so the directory is quoted safely)
+    data = _render_param_file(template, {
+        _TEMPLATE_OUTPUT_DIR.encode(): json.dumps(str(output_dir)).encode(),
+        _TEMPLATE_FIRST_FILE.encode(): json.dumps(first_file).encode(),
+        _TEMPLATE_LAST_FILE.encode(): json.dumps(last_file).encode(),
+        _TEMPLATE_MODULES.encode(): modules_block,
+    })
+
+    # Write test parameter file as YAML, in one binary write
+    if param_dir is None:
+        param_dir = temp_dir
+    param_path = Path(param_dir) / f"{output_name}.yaml"
+    with open(param_path, 'wb') as f:
+        f.write(data)
+
+    return param_path, output_dir, temp_dir
+
+
+def _list_logs(dir_str):
+    """
+    Log files in a directory, from one scandir pass
 
-    # Write test parameter file as YAML
-    param_path = Path(temp_dir) / f"{output_name}.yaml"
-    with open(param_path, 'w') as f:
-        f.write("#" + "="*77 + "\n")
-        f.write("# Mimic Test Configuration\n")
-        f.write("#" + "="*77 + "\n")
-        f.write("# Auto-generated test parameter file\n")
-        f.write("#" + "="*77 + "\n\n")
-        yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+    Not memoized: a directory mtime can miss a change made within the same
+    timestamp tick on filesystems with coarse timestamps.
+    """
+    with os.scandir(dir_str) as it:
+        return tuple(entry.path for entry in it
+                     if entry.name.endswith(".log") and not entry.name.startswith(".")
+                     and entry.is_file(follow_symlinks=False))
+
+
+def _find_leak_line(log_file, size):
+    """
+    First leak report in a log file (bytes), or None
+
+    Reads only the tail first, where a shutdown leak report normally is.
+    A tail without one proves nothing (an earlier line may report a leak),
+    so the whole file is then mapped and scanned.
+    """
+    with open(log_file, 'rb') as f:
+        if size > _LOG_TAIL_BYTES:
+            f.seek(size - _LOG_TAIL_BYTES)
+            tail = f.read()
+            tail = tail[tail.find(b"\n") + 1:]  # Drop the partial first line
+            match = _LEAK_RE.search(tail)
+            if match is not None:
+                return match.group()
+
+        # One case-insensitive regex pass over the mapped file, in C
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            match = _LEAK_RE.search(mm)
+            return match.group() if match is not None else None
+
+
+def find_memory_leak(output):
+    """
+    First memory leak report in captured Mimic output, or None
+
+    Mimic logs its shutdown leak check to its streams, so tests that keep
+    stdout/stderr can scan them directly (check_no_memory_leaks() scans the
+    log files in an output directory instead).
 
-    return param_path, output_dir, Path(temp_dir)
+    Args:
+        output (str or bytes): Captured stdout or stderr
+
+    Returns:
+        str: The offending line, or None if no leak is reported
+
+    Usage:
+        returncode, stdout, stderr = run_mimic(param_file)
+        leak = find_memory_leak(stderr) or find_memory_leak(stdout)
+        assert leak is None, f"Memory leak detected: {leak}"
+    """
+    if isinstance(output, str):
+        output = output.encode(errors='replace')
+    match = _LEAK_RE.search(output)
+    return match.group().decode(errors='replace') if match is not None else None
 
 
 def check_no_memory_leaks(output_dir):
@@ -249,30 +674,23 @@ def check_no_memory_leaks(output_dir):
         has_leaks = not check_no_memory_leaks(output_dir)
         assert not has_leaks, "Memory leaks detected"
     """
-    # ANSI color codes
-    YELLOW = '\033[1;33m'
-    RED = '\033[0;31m'
-    NC = '\033[0m'  # No Color
-
-    log_dir = output_dir / "metadata"
-    if not log_dir.exists():
-        print(f"{YELLOW}Warning: Log directory not found: {log_dir}{NC}")
+    log_dir = os.path.join(output_dir, "metadata")
+    try:
+        log_files = _list_logs(log_dir)
+    except (FileNotFoundError, NotADirectoryError):
+        print(_yellow(f"Warning: Log directory not found: {log_dir}"))
         return True  # Can't check, assume OK
 
-    for log_file in log_dir.glob("*.log"):
-        with open(log_file) as f:
-            for line in f:
-                line_lower = line.lower()
-                # Check for actual leak messages, not success messages
-                # "No memory leaks detected" is a success message, not a failure
-                if "memory leak" in line_lower:
-                    # Exclude success messages
-                    if "no memory leak" not in line_lower:
-                        # Check if it's a warning or error (not just INFO)
-                        if "warning" in line_lower or "error" in line_lower or "fatal" in line_lower:
-                            print(f"{RED}Memory leak detected in {log_file}{NC}")
-                            print(f"  {line.strip()}")
-                            return False
+    for log_file in log_files:
+        size = os.stat(log_file).st_size
+        if size == 0:
+            continue  # Nothing to scan (and an empty file cannot be mapped)
+
+        line = _find_leak_line(log_file, size)
+        if line is not None:
+            print(_red(f"Memory leak detected in {log_file}"))
+            print(f"  {line.decode(errors='replace').strip()}")
+            return False
 
     return True
 
@@ -283,8 +701,11 @@ __all__ = [
     'TEST_DATA_DIR',
     'MIMIC_EXE',
     'ensure_output_dirs',
+    'scratch_dir',
     'run_mimic',
+    'run_mimic_batch',
     'read_param_file',
     'create_test_param_file',
+    'find_memory_leak',
     'check_no_memory_leaks',
 ]
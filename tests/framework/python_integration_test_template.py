@@ -25,6 +25,9 @@ import numpy as np
 # Add output/mimic-plot to path for data loading utilities
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "output" / "mimic-plot"))
 
+# Leak scanning is shared with the core tests (framework/harness.py)
+from framework import check_no_memory_leaks
+
 # You may need to import plotting utilities for data loading
 # from mimic_plot import load_binary_data, load_hdf5_data
 
@@ -69,14 +72,17 @@ def load_binary_output(output_file):
         output_file (str): Path to binary output file
 
     Returns:
-        np.ndarray: Structured array with halo properties
+        np.ndarray: Structured array with halo properties (read-only memmap)
 
-    TODO: Implement using existing plotting infrastructure
-    See output/mimic-plot/mimic_plot.py for reference
+    The file is memory-mapped rather than read: only the header is parsed
+    up front and halo records are paged in as they are accessed, so large
+    outputs are never copied into memory. Use framework.load_binary_halos()
+    instead if the test needs a writable in-memory copy.
     """
-    # Implementation depends on binary format
-    # Use code from mimic-plot.py
-    raise NotImplementedError("Load binary data using mimic-plot utilities")
+    from framework import load_binary_halos_header_only
+
+    halos, _metadata = load_binary_halos_header_only(output_file)
+    return halos
 
 
 def load_hdf5_output(output_file):
@@ -97,34 +103,6 @@ def load_hdf5_output(output_file):
     raise NotImplementedError("Load HDF5 data using existing utilities")
 
 
-def check_no_memory_leaks(log_dir):
-    """
-    Check that Mimic run had no memory leaks
-
-    Args:
-        log_dir (str): Directory containing log files
-
-    Returns:
-        bool: True if no leaks, False if leaks detected
-
-    Example:
-        assert check_no_memory_leaks("tests/data/output/binary/metadata/")
-    """
-    log_dir = Path(log_dir)
-    if not log_dir.exists():
-        print(f"Warning: Log directory not found: {log_dir}")
-        return True
-
-    for log_file in log_dir.glob("*.log"):
-        with open(log_file) as f:
-            content = f.read().lower()
-            if "memory leak" in content:
-                print(f"Memory leak detected in {log_file}")
-                return False
-
-    return True
-
-
 def test_basic_integration():
     """
     [ONE-LINE DESCRIPTION OF WHAT THIS TEST DOES]
@@ -153,8 +131,8 @@ def test_basic_integration():
     # Check execution success
     assert returncode == 0, f"Mimic execution failed with code {returncode}\nSTDERR: {stderr}"
 
-    # Check no memory leaks
-    assert check_no_memory_leaks(output_dir / "metadata"), "Memory leak detected"
+    # Check no memory leaks (scans output_dir/metadata/*.log)
+    assert check_no_memory_leaks(output_dir), "Memory leak detected"
 
     # Check output files exist
     # expected_output = output_dir / "model_063.dat"
@@ -288,8 +266,8 @@ TEMPLATE USAGE INSTRUCTIONS:
    - Use descriptive test function names
 
 4. Implement data loading:
-   - Use existing utilities from output/mimic-plot/
-   - load_binary_output() or load_hdf5_output()
+   - load_binary_output() memory-maps binary output via tests/framework
+   - load_hdf5_output(): use existing utilities from output/mimic-plot/
    - Adapt to actual data formats
 
 5. Add test to pytest discovery:
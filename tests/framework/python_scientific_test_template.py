@@ -37,13 +37,76 @@ def load_halos(snapshot_file):
         snapshot_file (str): Path to snapshot output file
 
     Returns:
-        np.ndarray: Structured array with halo properties
+        np.ndarray: Structured array with halo properties (read-only memmap)
 
-    TODO: Implement using existing plotting infrastructure
-    See output/mimic-plot/ for reference implementations
+    Binary output is memory-mapped: only the header is parsed up front and
+    halo records are paged in as they are accessed. The framework has no
+    HDF5 loader; for HDF5 output see load_hdf5_halos() in
+    tests/integration/test_output_formats.py.
     """
-    # Use existing data loading utilities
-    raise NotImplementedError("Implement using mimic-plot utilities")
+    from framework import load_binary_halos_header_only
+
+    halos, _metadata = load_binary_halos_header_only(snapshot_file)
+    return halos
+
+
+def validate_halo_sanity(halos):
+    """
+    Check basic halo sanity with one fused mask
+
+    Combines the per-property conditions into a single boolean mask and
+    reduces it once, instead of one np.all() pass per condition, then
+    reports the first offending halo.
+
+    Args:
+        halos (np.ndarray): Structured array with Mvir, Rvir and Vvir fields
+
+    Raises:
+        AssertionError: If any halo has non-finite or non-positive values
+    """
+    mvir = halos['Mvir']
+    ok = np.isfinite(mvir) & (mvir > 0) & (halos['Rvir'] > 0) & (halos['Vvir'] > 0)
+    if not ok.all():
+        i = int(np.argmin(ok))  # First False
+        raise AssertionError(
+            f"Halo {i} fails sanity check: Mvir={mvir[i]}, "
+            f"Rvir={halos['Rvir'][i]}, Vvir={halos['Vvir'][i]} "
+            f"(need finite Mvir > 0, Rvir > 0, Vvir > 0)")
+
+
+def conservation_error(values, expected):
+    """
+    Relative error of a summed quantity against its expected total
+
+    np.sum runs as a compiled (pairwise) reduction; accumulating in float64
+    keeps float32 output fields from losing precision on large catalogues.
+
+    Args:
+        values (np.ndarray): Per-halo quantity (e.g. halos['Mvir'])
+        expected (float): Expected total
+
+    Returns:
+        float: |sum(values) - expected| / |expected|
+    """
+    total = np.sum(values, dtype=np.float64)
+    return abs(total - expected) / abs(expected)
+
+
+def virial_ratio(halos, G):
+    """
+    Per-halo ratio Vvir^2 Rvir / (G Mvir), which is 1 for virialized halos
+
+    Computed as whole-array float64 expressions, with no Python-level loop.
+
+    Args:
+        halos (np.ndarray): Structured array with Mvir, Rvir and Vvir fields
+        G (float): Gravitational constant in the output's internal units
+
+    Returns:
+        np.ndarray: Ratio per halo
+    """
+    vvir = halos['Vvir'].astype(np.float64)
+    return vvir * vvir * halos['Rvir'] / (G * halos['Mvir'])
 
 
 def test_physics_sanity_check():
@@ -62,18 +125,14 @@ def test_physics_sanity_check():
     # halos = load_halos("tests/data/output/binary/model_z0.000_0")
 
     # ===== VALIDATE RANGES =====
-    # Check that physical quantities are in reasonable ranges
-    # assert np.all(halos['Mvir'] > 0), "Mvir must be positive"
-    # assert np.all(halos['Rvir'] > 0), "Rvir must be positive"
-    # assert np.all(halos['Vvir'] > 0), "Vvir must be positive"
-
-    # Check for NaN or Inf
-    # assert np.all(np.isfinite(halos['Mvir'])), "Mvir contains NaN/Inf"
+    # Check that physical quantities are finite and in reasonable ranges.
+    # Prefer one fused mask over a separate np.all() per condition:
+    # validate_halo_sanity(halos)  # Mvir finite and > 0, Rvir > 0, Vvir > 0
 
     # ===== VALIDATE PHYSICS =====
     # Check physical relationships
-    # virial_check = halos['Vvir']**2 / halos['Rvir']  # Should relate to Mvir
-    # assert np.all(virial_check > 0), "Virial relationship broken"
+    # ratio = virial_ratio(halos, G)  # Vvir^2 = G Mvir / Rvir
+    # assert np.allclose(ratio, 1.0, rtol=1e-3), "Virial relationship broken"
 
     print("✓ Physics sanity check passed")
 
@@ -94,12 +153,11 @@ def test_conservation_law():
 
     # ===== CALCULATE QUANTITY =====
     # Compute total conserved quantity
-    # total_mass = np.sum(halos['Mvir'])
     # expected_mass = 1.0e12  # Known value or calculated from input
 
     # ===== VALIDATE CONSERVATION =====
     # Check conservation within tolerance
-    # relative_error = abs(total_mass - expected_mass) / expected_mass
+    # relative_error = conservation_error(halos['Mvir'], expected_mass)
     # tolerance = 0.01  # 1%
 
     # assert relative_error < tolerance, \
@@ -126,22 +184,22 @@ def test_property_ranges():
 
     # Example: Spin parameter should be 0 < λ < 1
     # spin_params = halos['Spin']
-    # assert np.all(spin_params >= 0), "Spin parameter cannot be negative"
-    # assert np.all(spin_params <= 1), "Spin parameter cannot exceed 1"
+    # ok = (spin_params >= 0) & (spin_params <= 1)
+    # assert ok.all(), f"Spin outside [0, 1] at halo {np.argmin(ok)}"
     # median_spin = np.median(spin_params)
     # assert 0.01 < median_spin < 0.1, \
     #     f"Median spin unreasonable: {median_spin} (expected 0.01-0.1)"
 
     # Example: Concentration should be 1 < c < 50
     # concentrations = halos['Concentration']
-    # assert np.all(concentrations > 1), "Concentration must be > 1"
-    # assert np.all(concentrations < 50), "Concentration unreasonably high"
+    # ok = (concentrations > 1) & (concentrations < 50)
+    # assert ok.all(), f"Concentration outside (1, 50) at halo {np.argmin(ok)}"
 
     # Example: Positions should be within box
     # box_size = 500.0  # Mpc/h
     # positions = halos['Pos']  # Shape: (N, 3)
-    # assert np.all(positions >= 0), "Positions cannot be negative"
-    # assert np.all(positions < box_size), f"Positions exceed box size {box_size}"
+    # ok = ((positions >= 0) & (positions < box_size)).all(axis=1)
+    # assert ok.all(), f"Position outside [0, {box_size}) at halo {np.argmin(ok)}"
 
     print("✓ Property ranges validated")
 
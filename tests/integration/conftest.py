@@ -0,0 +1,82 @@
+"""
+Shared fixtures for the core integration tests
+"""
+
+import mmap
+from types import SimpleNamespace
+
+import pytest
+
+from framework import MIMIC_EXE, TEST_DATA_DIR, run_mimic
+
+
+@pytest.fixture(scope="session")
+def mimic_exe():
+    """
+    Path to the Mimic executable, checked once per session
+
+    Skips the requesting tests when Mimic has not been built.
+    """
+    if not MIMIC_EXE.exists():
+        pytest.skip(f"Mimic not built ({MIMIC_EXE}); build it first with: make")
+    return MIMIC_EXE
+
+
+def _built_with_hdf5(exe):
+    """
+    Whether a Mimic executable was built with HDF5 support (make USE-HDF5=yes)
+
+    Looks for an HDF5 library symbol in the binary itself, so finding out
+    costs one scan of the file rather than a Mimic run.
+    """
+    with open(exe, 'rb') as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return mm.find(b"H5Fcreate") != -1
+
+
+def _shared_run(param_name, output_subdir):
+    """Run Mimic once on tests/data/<param_name>, as a namespace of its results"""
+    param_file = TEST_DATA_DIR / param_name
+    assert param_file.exists(), f"Test parameter file not found: {param_file}"
+    returncode, stdout, stderr = run_mimic(param_file)
+    return SimpleNamespace(
+        returncode=returncode,
+        stdout=stdout,
+        stderr=stderr,
+        param_file=param_file,
+        output_dir=TEST_DATA_DIR / "output" / output_subdir,
+    )
+
+
+@pytest.fixture(scope="session")
+def mimic_run(mimic_exe):
+    """
+    One Mimic run of tests/data/test_binary.yaml, shared by the session
+
+    For tests that only inspect the run's exit status, streams or output
+    files. The run writes to tests/data/output/binary/, so tests using it
+    belong in the "tests_data_output" xdist group; the whole group then
+    shares a single worker, and so this one run.
+
+    Attributes:
+        returncode, stdout, stderr: As returned by run_mimic()
+        param_file (Path): The parameter file that was run
+        output_dir (Path): Where the run wrote its output
+    """
+    return _shared_run("test_binary.yaml", "binary")
+
+
+@pytest.fixture(scope="session")
+def mimic_hdf5_run(mimic_exe):
+    """
+    One Mimic run of tests/data/test_hdf5.yaml, shared by the session
+
+    As mimic_run, for the HDF5 output format (written to
+    tests/data/output/hdf5/). Skips when test_hdf5.yaml does not exist, or
+    (without running it) when Mimic was built without HDF5.
+    """
+    if not (TEST_DATA_DIR / "test_hdf5.yaml").exists():
+        pytest.skip("test_hdf5.yaml not found")
+    if not _built_with_hdf5(mimic_exe):
+        pytest.skip("Mimic not compiled with HDF5 support")
+    return _shared_run("test_hdf5.yaml", "hdf5")
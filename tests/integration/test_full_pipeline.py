@@ -26,52 +26,48 @@ Date: 2025-11-08
 import sys
 from pathlib import Path
 
+import pytest
+
 # Add framework to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from framework import (
-    REPO_ROOT,
-    TEST_DATA_DIR,
-    MIMIC_EXE,
     ensure_output_dirs,
-    run_mimic,
     check_no_memory_leaks,
 )
 
+# ANSI color codes
+RED = '\033[0;31m'
+NC = '\033[0m'  # No Color
+
 # Ensure output directories exist before any tests run
 ensure_output_dirs()
 
+# Every test here runs Mimic into the shared tests/data/output/ tree; under
+# pytest-xdist (--dist loadgroup) they all stay on one worker
+pytestmark = pytest.mark.xdist_group("tests_data_output")
 
-def test_basic_execution():
+
+def test_basic_execution(mimic_run):
     """
     Test that Mimic executes successfully
 
     Expected: Exit code 0, no crashes
     Validates: Basic pipeline execution
     """
-    # ANSI color codes
-    RED = '\033[0;31m'
-    NC = '\033[0m'  # No Color
-
     print("Testing basic Mimic execution...")
 
-    # Run Mimic on test parameter file
-    param_file = TEST_DATA_DIR / "test_binary.yaml"
-    assert param_file.exists(), f"{RED}Test parameter file not found: {param_file}{NC}"
-
-    returncode, stdout, stderr = run_mimic(param_file)
-
-    # Check execution success
-    if returncode != 0:
-        print(f"STDOUT:\n{stdout}")
-        print(f"STDERR:\n{stderr}")
-        assert False, f"{RED}Mimic execution failed with code {returncode}{NC}"
+    # Check execution success of the shared test_binary.yaml run
+    if mimic_run.returncode != 0:
+        print(f"STDOUT:\n{mimic_run.stdout}")
+        print(f"STDERR:\n{mimic_run.stderr}")
+        assert False, f"{RED}Mimic execution failed with code {mimic_run.returncode}{NC}"
 
     print("  ✓ Mimic executed successfully")
-    print(f"  Exit code: {returncode}")
+    print(f"  Exit code: {mimic_run.returncode}")
 
 
-def test_output_files_created():
+def test_output_files_created(mimic_run):
     """
     Test that output files are created
 
@@ -82,19 +78,9 @@ def test_output_files_created():
 
     # Expected output location (from test_binary.yaml: writes to binary/)
     # Binary format uses redshift-based naming: model_z{redshift}_{filenr}
-    output_dir = TEST_DATA_DIR / "output" / "binary"
-    output_file = output_dir / "model_z0.000_0"  # snapshot 63 is z=0
+    output_file = mimic_run.output_dir / "model_z0.000_0"  # snapshot 63 is z=0
 
-    # ANSI color codes
-    RED = '\033[0;31m'
-    NC = '\033[0m'  # No Color
-
-    # Run Mimic if output doesn't exist
-    if not output_file.exists():
-        print("  Running Mimic to generate output...")
-        param_file = TEST_DATA_DIR / "test_binary.yaml"
-        returncode, stdout, stderr = run_mimic(param_file)
-        assert returncode == 0, f"{RED}Mimic execution failed{NC}"
+    assert mimic_run.returncode == 0, f"{RED}Mimic execution failed{NC}"
 
     # Check output file exists
     assert output_file.exists(), f"{RED}Output file not created: {output_file}{NC}"
@@ -106,34 +92,26 @@ def test_output_files_created():
     print(f"  File size: {file_size:,} bytes")
 
 
-def test_no_memory_leaks():
+def test_no_memory_leaks(mimic_run):
     """
     Test that Mimic runs without memory leaks
 
     Expected: Zero memory leaks reported in logs
     Validates: Memory management correctness
     """
-    # ANSI color codes
-    RED = '\033[0;31m'
-    NC = '\033[0m'  # No Color
-
     print("Testing for memory leaks...")
 
-    # Run Mimic
-    param_file = TEST_DATA_DIR / "test_binary.yaml"
-    returncode, stdout, stderr = run_mimic(param_file)
-    assert returncode == 0, f"{RED}Mimic execution failed{NC}"
+    assert mimic_run.returncode == 0, f"{RED}Mimic execution failed{NC}"
 
     # Check for memory leaks in output logs (test_binary.yaml writes to binary/)
-    output_dir = TEST_DATA_DIR / "output" / "binary"
-    has_leaks = not check_no_memory_leaks(output_dir)
+    has_leaks = not check_no_memory_leaks(mimic_run.output_dir)
 
     assert not has_leaks, f"{RED}Memory leaks detected in Mimic run{NC}"
 
     print("  ✓ No memory leaks detected")
 
 
-def test_output_loadable():
+def test_output_loadable(mimic_run):
     """
     Test that output file can be loaded and has valid structure
 
@@ -144,18 +122,9 @@ def test_output_loadable():
 
     # Expected output file (test_binary.yaml writes to binary/)
     # Binary format uses redshift-based naming: model_z{redshift}_{filenr}
-    output_dir = TEST_DATA_DIR / "output" / "binary"
-    output_file = output_dir / "model_z0.000_0"  # snapshot 63 is z=0
+    output_file = mimic_run.output_dir / "model_z0.000_0"  # snapshot 63 is z=0
 
-    # ANSI color codes
-    RED = '\033[0;31m'
-    NC = '\033[0m'  # No Color
-
-    # Ensure output exists
-    if not output_file.exists():
-        param_file = TEST_DATA_DIR / "test_binary.yaml"
-        returncode, stdout, stderr = run_mimic(param_file)
-        assert returncode == 0, f"{RED}Mimic execution failed{NC}"
+    assert mimic_run.returncode == 0, f"{RED}Mimic execution failed{NC}"
 
     # Try to load output file
     # Note: This is a basic check - just verify we can read binary data
@@ -168,22 +137,17 @@ def test_output_loadable():
     print(f"  File: {output_file}")
 
 
-def test_stdout_content():
+def test_stdout_content(mimic_run):
     """
     Test that Mimic produces expected output messages
 
     Expected: Key progress messages in stdout
     Validates: Execution flow and logging
     """
-    # ANSI color codes
-    RED = '\033[0;31m'
-    NC = '\033[0m'  # No Color
-
     print("Testing stdout content...")
 
-    param_file = TEST_DATA_DIR / "test_binary.yaml"
-    returncode, stdout, stderr = run_mimic(param_file)
-    assert returncode == 0, f"{RED}Mimic execution failed{NC}"
+    stdout, stderr = mimic_run.stdout, mimic_run.stderr
+    assert mimic_run.returncode == 0, f"{RED}Mimic execution failed{NC}"
 
     # Check for key messages
     assert "Mimic" in stdout or "Mimic" in stderr, \
@@ -197,73 +161,6 @@ def test_stdout_content():
     print("  ✓ Stdout contains expected content")
 
 
-def main():
-    """
-    Main test runner
-
-    Executes all test cases and reports results.
-    Can be run directly or via pytest.
-    """
-    # ANSI color codes
-    RED = '\033[0;31m'
-    NC = '\033[0m'  # No Color
-
-    print("Integration Test: Full Pipeline")
-    print(f"Repository root: {REPO_ROOT}")
-    print(f"Mimic executable: {MIMIC_EXE}")
-
-    # Check prerequisites
-    if not MIMIC_EXE.exists():
-        print(f"{RED}ERROR: Mimic executable not found: {MIMIC_EXE}{NC}")
-        print("Build it first with: make")
-        return 1
-
-    tests = [
-        test_basic_execution,
-        test_output_files_created,
-        test_no_memory_leaks,
-        test_output_loadable,
-        test_stdout_content,
-    ]
-
-    passed = 0
-    failed = 0
-
-    # ANSI color codes
-    RED = '\033[0;31m'
-    GREEN = '\033[0;32m'
-    NC = '\033[0m'  # No Color
-
-    for test in tests:
-        print()
-        try:
-            test()
-            passed += 1
-        except AssertionError as e:
-            print(f"{RED}✗ FAIL: {test.__name__}{NC}")
-            print(f"  {e}")
-            failed += 1
-        except Exception as e:
-            print(f"{RED}✗ ERROR: {test.__name__}{NC}")
-            print(f"  {e}")
-            failed += 1
-
-    print()
-    print("=" * 60)
-    print("Test Summary: Full Pipeline")
-    print("=" * 60)
-    print(f"Passed: {passed}")
-    print(f"Failed: {failed}")
-    print(f"Total:  {passed + failed}")
-    print("=" * 60)
-
-    if failed == 0:
-        print(f"{GREEN}✓ All tests passed!{NC}")
-        return 0
-    else:
-        print(f"{RED}✗ {failed} test(s) failed{NC}")
-        return 1
-
-
 if __name__ == "__main__":
-    sys.exit(main())
+    # The tests share a session fixture, so they are run through pytest
+    sys.exit(pytest.main([__file__, "-v"]))
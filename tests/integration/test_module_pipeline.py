@@ -10,6 +10,14 @@ This test validates that Mimic's module system works end-to-end:
 - Different module combinations work correctly
 - Log messages confirm module initialization
 
+Test cases (TestModulePipeline.test_module_configuration, parametrized over CASES):
+  - physics_free_mode: No modules enabled (halo tracking only)
+  - single_module_execution: test_fixture in isolation
+  - multiple_modules_execution: Module list handling (test_fixture twice)
+  - custom_parameter_values: Non-default parameter values are used
+  - unknown_module_error: Unknown module names produce clear errors
+  - module_execution_order: Modules run in EnabledModules order
+
 Phase: Phase 3 (Runtime Module Configuration)
 Author: Mimic Development Team
 Date: 2025-11-09
@@ -17,238 +25,139 @@ Date: 2025-11-09
 
 import os
 import sys
-import shutil
-import subprocess
-import tempfile
-import unittest
+from collections import namedtuple
 from pathlib import Path
 
-# Add framework to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from framework import (
-    REPO_ROOT,
-    MIMIC_EXE,
-    read_param_file,
-    create_test_param_file,
-    run_mimic,
-)
-
-class TestModulePipeline(unittest.TestCase):
-    """Integration tests for module configuration and execution."""
-
-    @classmethod
-    def setUpClass(cls):
-        """Set up test environment once for all tests."""
-        # Get repository root
-        cls.repo_root = str(REPO_ROOT)
+import pytest
 
-        # Path to mimic executable
-        cls.mimic_exe = str(MIMIC_EXE)
+# Add framework to path (pytest.ini does this under pytest; needed when the
+# file is run as a script)
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
-        # Check mimic is compiled
-        if not MIMIC_EXE.exists():
-            raise RuntimeError(
-                f"Mimic executable not found at {MIMIC_EXE}. "
-                "Run 'make' to compile."
+from framework import REPO_ROOT, create_test_param_file, run_mimic_batch
+
+# Reference parameter file (parsed and rendered once by the harness, which
+# caches both per path and mtime, then reused by every case)
+REF_PARAM_FILE = os.path.join(REPO_ROOT, "input", "millennium.yaml")
+
+# One test case: name, modules to enable (None = physics-free), module
+# parameters, whether the run should succeed, and the byte strings
+# its output must contain (stdout on success, stdout + stderr on failure;
+# the streams are kept as bytes, never decoded)
+Case = namedtuple("Case", ["name", "enabled_modules", "module_params",
+                           "succeeds", "expected"])
+
+# Cases with the same modules and parameters share one Mimic run (see
+# pipeline_runs)
+CASES = [
+    Case("physics_free_mode", None, None, True,
+         [b"No modules enabled"]),
+    Case("single_module_execution", ["test_fixture"],
+         {"TestFixture_DummyParameter": "2.5"}, True,
+         [b"Test fixture module initialized", b"DummyParameter = 2.500"]),
+    # test_fixture enabled twice (tests module list handling)
+    Case("multiple_modules_execution", ["test_fixture", "test_fixture"],
+         {"TestFixture_DummyParameter": "1.5",
+          "TestFixture_EnableLogging": "0"}, True,
+         [b"Test fixture module initialized", b"DummyParameter = 1.500",
+          b"EnableLogging = 0"]),
+    # Non-default DummyParameter must be read and logged
+    Case("custom_parameter_values", ["test_fixture"],
+         {"TestFixture_DummyParameter": "3.14"}, True,
+         [b"DummyParameter = 3.140"]),
+    # The error must name the problem and list the available modules
+    Case("unknown_module_error", ["nonexistent_module"], None, False,
+         [b"not registered", b"Available modules:", b"test_fixture"]),
+    # Basic execution ordering infrastructure only; dependency-based ordering
+    # is tested once modules with actual dependencies exist (e.g.
+    # sage_cooling depends on sage_infall). Same configuration as
+    # single_module_execution, so its run is reused
+    Case("module_execution_order", ["test_fixture"],
+         {"TestFixture_DummyParameter": "2.5"}, True,
+         [b"Test fixture module initialized"]),
+]
+
+# The cases share one batch of runs (see pipeline_runs); keep them on one
+# pytest-xdist worker (--dist loadgroup) so the batch runs once
+pytestmark = pytest.mark.xdist_group("module_pipeline")
+
+
+def _config_key(case):
+    """Hashable run configuration of a case: its modules and parameters"""
+    return (tuple(case.enabled_modules or ()),
+            tuple(sorted((case.module_params or {}).items())))
+
+
+@pytest.fixture(scope="module")
+def pipeline_runs(mimic_exe, mimic_tmp):
+    """
+    Run Mimic once per distinct configuration in CASES, concurrently
+
+    Parameter files are written serially (cheap), one per configuration and
+    named after its first case, then the independent Mimic runs are
+    overlapped by run_mimic_batch(); the tests only check the collected
+    results. Every session runs Mimic afresh; nothing is reused between
+    sessions.
+
+    Returns:
+        dict: case name -> (returncode, stdout, stderr, output_dir), with
+        stdout and stderr as bytes
+    """
+    runs = {}  # config key -> (param_file, output_dir)
+    for case in CASES:
+        key = _config_key(case)
+        if key not in runs:
+            param_file, output_dir, _ = create_test_param_file(
+                output_name=case.name,
+                enabled_modules=case.enabled_modules,
+                module_params=case.module_params,
+                first_file=0,
+                last_file=0,
+                ref_param_file=REF_PARAM_FILE,
+                temp_dir=mimic_tmp
             )
+            runs[key] = (param_file, output_dir)
 
-        # Reference parameter file
-        cls.ref_param_file = os.path.join(
-            cls.repo_root, "input", "millennium.yaml"
-        )
-
-        # Create temporary directory for test outputs
-        cls.temp_dir = tempfile.mkdtemp(prefix="mimic_module_test_")
-
-    @classmethod
-    def tearDownClass(cls):
-        """Clean up test environment."""
-        # Remove temporary directory
-        if os.path.exists(cls.temp_dir):
-            shutil.rmtree(cls.temp_dir)
-
-    def test_physics_free_mode(self):
-        """Test physics-free mode (no modules enabled)."""
-        # Create parameter file with no modules
-        param_file, output_dir, _ = create_test_param_file(
-            output_name="physics_free",
-            enabled_modules=None,  # No modules
-            first_file=0,
-            last_file=0,
-            temp_dir=self.temp_dir
-        )
-
-        # Run mimic
-        returncode, stdout, stderr = run_mimic(param_file)
-
-        # Verify execution succeeded
-        self.assertEqual(returncode, 0,
-                        f"Mimic failed in physics-free mode:\n{stderr}")
-
-        # Verify log messages
-        self.assertIn("No modules enabled", stdout,
-                     "Should log physics-free mode")
-
-        # Verify output directory was created
-        self.assertTrue(output_dir.exists(),
-                       "Output directory should be created")
-
-    def test_single_module_execution(self):
-        """Test single module execution in isolation."""
-        # Create parameter file with only test_fixture
-        param_file, output_dir, _ = create_test_param_file(
-            output_name="single_module",
-            enabled_modules=["test_fixture"],
-            module_params={
-                "TestFixture_DummyParameter": "2.5"
-            },
-            first_file=0,
-            last_file=0,
-            temp_dir=self.temp_dir
-        )
-
-        # Run mimic
-        returncode, stdout, stderr = run_mimic(param_file)
-
-        # Verify execution succeeded
-        self.assertEqual(returncode, 0,
-                        f"Mimic failed with test_fixture:\n{stderr}")
-
-        # Verify module was initialized with correct parameters
-        self.assertIn("Test fixture module initialized", stdout)
-        self.assertIn("DummyParameter = 2.500", stdout)
-
-        # Verify output directory was created
-        self.assertTrue(output_dir.exists(),
-                       "Output directory should be created")
-
-    def test_multiple_modules_execution(self):
-        """Test multiple module execution together."""
-        # Create parameter file with test_fixture enabled twice (tests module list handling)
-        param_file, output_dir, _ = create_test_param_file(
-            output_name="multiple_modules",
-            enabled_modules=["test_fixture", "test_fixture"],
-            module_params={
-                "TestFixture_DummyParameter": "1.5",
-                "TestFixture_EnableLogging": "0"
-            },
-            first_file=0,
-            last_file=0,
-            temp_dir=self.temp_dir
-        )
-
-        # Run mimic
-        returncode, stdout, stderr = run_mimic(param_file)
-
-        # Verify execution succeeded
-        self.assertEqual(returncode, 0,
-                        f"Mimic failed with multiple modules:\n{stderr}")
-
-        # Verify module was initialized with correct parameters
-        self.assertIn("Test fixture module initialized", stdout)
-        self.assertIn("DummyParameter = 1.500", stdout)
-        self.assertIn("EnableLogging = 0", stdout)
-
-        # Verify output directory was created
-        self.assertTrue(output_dir.exists(),
-                       "Output directory should be created")
-
-    def test_custom_parameter_values(self):
-        """Test that custom parameter values are actually used."""
-        # Run with non-default dummy parameter
-        param_file, output_dir, _ = create_test_param_file(
-            output_name="custom_params",
-            enabled_modules=["test_fixture"],
-            module_params={
-                "TestFixture_DummyParameter": "3.14"  # Non-default
-            },
-            first_file=0,
-            last_file=0,
-            temp_dir=self.temp_dir
-        )
-
-        # Run mimic
-        returncode, stdout, stderr = run_mimic(param_file)
-
-        # Verify execution succeeded
-        self.assertEqual(returncode, 0,
-                        f"Mimic failed with custom parameters:\n{stderr}")
-
-        # Verify custom parameter was read
-        self.assertIn("DummyParameter = 3.140", stdout,
-                     "Custom parameter value should be logged")
-
-    def test_unknown_module_error(self):
-        """Test that unknown module names produce clear errors."""
-        # Create parameter file with invalid module
-        param_file, output_dir, _ = create_test_param_file(
-            output_name="unknown_module",
-            enabled_modules=["nonexistent_module"],
-            first_file=0,
-            last_file=0,
-            temp_dir=self.temp_dir
-        )
-
-        # Run mimic
-        returncode, stdout, stderr = run_mimic(param_file)
-
-        # Verify execution failed
-        self.assertNotEqual(returncode, 0,
-                           "Mimic should fail with unknown module")
-
-        # Verify error message lists available modules
-        combined_output = stdout + stderr
-        self.assertIn("not registered", combined_output,
-                     "Should report module not registered")
-        self.assertIn("Available modules:", combined_output,
-                     "Should list available modules")
-        self.assertIn("test_fixture", combined_output,
-                     "Should list test_fixture as available")
-
-    def test_module_execution_order(self):
-        """Test that modules execute in the order specified in EnabledModules.
-
-        Note: This test validates basic execution ordering infrastructure.
-        Dependency-based ordering will be tested when modules with actual
-        dependencies are implemented (e.g., sage_cooling depends on sage_infall).
-        """
-        # Create parameter file with test_fixture
-        param_file, output_dir, _ = create_test_param_file(
-            output_name="execution_order",
-            enabled_modules=["test_fixture"],
-            module_params={
-                "TestFixture_DummyParameter": "1.0"
-            },
-            first_file=0,
-            last_file=0,
-            temp_dir=self.temp_dir
-        )
-
-        # Run mimic
-        returncode, stdout, stderr = run_mimic(param_file)
-
-        # Verify execution succeeded
-        self.assertEqual(returncode, 0,
-                        f"Mimic should succeed:\n{stderr}")
+    results = run_mimic_batch((param_file for param_file, _ in runs.values()),
+                              text=False)
+    by_key = {key: (*result, output_dir)
+              for (key, (_, output_dir)), result in zip(runs.items(), results)}
+    return {case.name: by_key[_config_key(case)] for case in CASES}
 
-        # Verify module was initialized (basic ordering infrastructure works)
-        self.assertIn("Test fixture module initialized", stdout,
-                     "Module should be initialized in pipeline")
 
+class TestModulePipeline:
+    """Integration tests for module configuration and execution."""
 
-def main():
-    """Main test runner."""
-    # Set up test suite
-    suite = unittest.TestLoader().loadTestsFromTestCase(TestModulePipeline)
+    @pytest.mark.parametrize("case", CASES, ids=lambda c: c.name)
+    def test_module_configuration(self, case, pipeline_runs):
+        """
+        Test: Mimic with one module configuration
 
-    # Run tests with verbose output
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
+        Expected: The run succeeds (or fails) as the case says, with every
+        expected string in its output
+        """
+        # Mimic run (shared batch, see pipeline_runs)
+        returncode, stdout, stderr, output_dir = pipeline_runs[case.name]
+
+        if case.succeeds:
+            # Verify execution succeeded
+            assert returncode == 0, (
+                f"Mimic failed in case {case.name}:\n"
+                f"{stderr.decode(errors='replace')}")
+            output = stdout
+
+            # Verify output directory was created
+            assert output_dir.exists(), "Output directory should be created"
+        else:
+            # Verify execution failed
+            assert returncode != 0, f"Mimic should fail in case {case.name}"
+            output = stdout + stderr
 
-    # Return exit code based on results
-    return 0 if result.wasSuccessful() else 1
+        # Verify log messages
+        for text in case.expected:
+            assert text in output, f"{text.decode()!r} should appear in output"
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    # The cases share a module fixture, so they are run through pytest
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -28,6 +28,7 @@ import sys
 from io import StringIO
 from pathlib import Path
 import numpy as np
+import pytest
 
 # Add framework to path
 REPO_ROOT = Path(__file__).parent.parent.parent
@@ -38,7 +39,6 @@ from framework import (
     TEST_DATA_DIR,
     MIMIC_EXE,
     ensure_output_dirs,
-    run_mimic,
 )
 
 # Core halo properties (physics-agnostic, always present)
@@ -52,32 +52,39 @@ CORE_HALO_PROPERTIES = {
     'infallVvir', 'infallVmax'
 }
 
+# ANSI color codes
+RED = '\033[0;31m'
+GREEN = '\033[0;32m'
+NC = '\033[0m'  # No Color
+
 # Ensure output directories exist before any tests run
 ensure_output_dirs()
 
+# Every test here runs Mimic into the shared tests/data/output/ tree; under
+# pytest-xdist (--dist loadgroup) they all stay on one worker
+pytestmark = [
+    pytest.mark.xdist_group("tests_data_output"),
+    pytest.mark.skipif(not MIMIC_EXE.exists(), reason="Mimic not built"),
+]
+
 
-def check_hdf5_support():
+def check_hdf5_support(hdf5_run):
     """
     Check if Mimic was compiled with HDF5 support
 
+    Args:
+        hdf5_run: The shared test_hdf5.yaml run (mimic_hdf5_run fixture)
+
     Returns:
         bool: True if HDF5 support is available
     """
-    # Run mimic with --version or similar to check for HDF5
-    # For now, we'll check if HDF5 output succeeds
-    param_file = TEST_DATA_DIR / "test_hdf5.yaml"
-    if not param_file.exists():
-        return False
-
-    returncode, stdout, stderr = run_mimic(param_file)
-
     # If it fails with "unknown output format" or similar, HDF5 not supported
-    if returncode != 0:
-        output = (stdout + stderr).lower()
+    if hdf5_run.returncode != 0:
+        output = (hdf5_run.stdout + hdf5_run.stderr).lower()
         if "hdf5" in output and ("unknown" in output or "not supported" in output or "not compiled" in output):
             return False
 
-    return returncode == 0
+    return hdf5_run.returncode == 0
 
 
 def load_hdf5_halos(output_file):
@@ -90,10 +97,6 @@ def load_hdf5_halos(output_file):
     Returns:
         tuple: (halos, metadata) where halos is structured array
     """
-    # ANSI color codes
-    RED = '\033[0;31m'
-    NC = '\033[0m'  # No Color
-
     try:
         import h5py
     except ImportError:
@@ -300,17 +303,13 @@ def compare_halos_comprehensive(halos1, halos2, label1="dataset1", label2="datas
                 report.write(f"\n⚠️  Property '{prop_name}' (type {dtype}) differs but comparison method unknown\n")
                 all_passed = False
 
-    # ANSI color codes
-    GREEN = '\033[0;32m'
-    NC = '\033[0m'  # No Color
-
     if all_passed:
         report.write(f"\n{GREEN}✓ All {len(common_props)} properties match for all {n_halos} halos{NC}\n")
 
     return all_passed, report.getvalue()
 
 
-def test_binary_format_execution():
+def test_binary_format_execution(mimic_run):
     """
     Test that Mimic runs successfully with binary output format
 
@@ -320,23 +319,14 @@ def test_binary_format_execution():
     """
     print("Testing binary format execution...")
 
-    if not MIMIC_EXE.exists():
-        print(f"  Skipping (Mimic not built)")
-        return
-
-    param_file = TEST_DATA_DIR / "test_binary.yaml"
-    assert param_file.exists(), f"Parameter file not found: {param_file}"
-
-    # Run Mimic
-    returncode, _stdout, stderr = run_mimic(param_file)
-
-    # Check execution success
-    assert returncode == 0, f"Mimic failed with code {returncode}\nSTDERR: {stderr}"
+    # Check execution success of the shared test_binary.yaml run
+    assert mimic_run.returncode == 0, \
+        f"Mimic failed with code {mimic_run.returncode}\nSTDERR: {mimic_run.stderr}"
 
     print(f"  ✓ Binary format execution successful")
 
 
-def test_binary_format_loading():
+def test_binary_format_loading(mimic_run):
     """
     Test that binary output file can be loaded and parsed
 
@@ -346,21 +336,10 @@ def test_binary_format_loading():
     """
     print("Testing binary format data loading...")
 
-    if not MIMIC_EXE.exists():
-        print(f"  Skipping (Mimic not built)")
-        return
-
     # Check output file exists
-    output_dir = TEST_DATA_DIR / "output" / "binary"
-    output_file = output_dir / "model_z0.000_0"  # snapshot 63 is z=0
-
-    # Run Mimic if needed
-    if not output_file.exists():
-        print(f"  Running Mimic to generate output...")
-        param_file = TEST_DATA_DIR / "test_binary.yaml"
-        returncode, _, stderr = run_mimic(param_file)
-        assert returncode == 0, f"Mimic execution failed: {stderr}"
+    output_file = mimic_run.output_dir / "model_z0.000_0"  # snapshot 63 is z=0
 
+    assert mimic_run.returncode == 0, f"Mimic execution failed: {mimic_run.stderr}"
     assert output_file.exists(), f"Binary output file not created: {output_file}"
 
     # Load halos
@@ -377,7 +356,8 @@ def test_binary_format_loading():
     print(f"    Trees: {metadata.get('Ntrees', 'N/A')}, File size: {output_file.stat().st_size:,} bytes")
 
 
-def test_binary_baseline_comparison():
+@pytest.mark.skip(reason="binary format cannot handle schema evolution (see docstring)")
+def test_binary_baseline_comparison(mimic_run):
     """
     CURRENTLY DISABLED - Binary baseline comparison
 
@@ -396,19 +376,9 @@ def test_binary_baseline_comparison():
     """
     print("Testing binary baseline comparison...")
 
-    if not MIMIC_EXE.exists():
-        print(f"  Skipping (Mimic not built)")
-        return
-
     # Load current test output
-    output_dir = TEST_DATA_DIR / "output" / "binary"
-    output_file = output_dir / "model_z0.000_0"
-
-    # Run Mimic if needed
-    if not output_file.exists():
-        param_file = TEST_DATA_DIR / "test_binary.yaml"
-        returncode, _, stderr = run_mimic(param_file)
-        assert returncode == 0, f"Mimic execution failed: {stderr}"
+    output_file = mimic_run.output_dir / "model_z0.000_0"
+    assert mimic_run.returncode == 0, f"Mimic execution failed: {mimic_run.stderr}"
 
     print(f"  Loading CURRENT: {output_file.relative_to(REPO_ROOT)}")
     halos_test, metadata_test = load_binary_halos(output_file)
@@ -418,10 +388,6 @@ def test_binary_baseline_comparison():
     baseline_dir = TEST_DATA_DIR / "output" / "baseline" / "binary"
     baseline_file = baseline_dir / "model_z0.000_0"
 
-    # ANSI color codes
-    RED = '\033[0;31m'
-    NC = '\033[0m'  # No Color
-
     assert baseline_file.exists(), (
         f"{RED}Baseline file not found: {baseline_file}\n"
         f"Run Mimic once to establish baseline, then commit the baseline file.{NC}"
@@ -455,10 +421,6 @@ def test_binary_baseline_comparison():
         properties_to_compare=CORE_HALO_PROPERTIES
     )
 
-    # ANSI color codes
-    GREEN = '\033[0;32m'
-    NC = '\033[0m'  # No Color
-
     # Print report
     print(report, end='')  # Remove blank line after report
 
@@ -472,7 +434,7 @@ def test_binary_baseline_comparison():
     print(f"{GREEN}  ✓ Binary output matches baseline - all core properties validated{NC}")
 
 
-def test_hdf5_format_execution():
+def test_hdf5_format_execution(mimic_hdf5_run):
     """
     Test that Mimic runs successfully with HDF5 output format
 
@@ -482,33 +444,19 @@ def test_hdf5_format_execution():
     """
     print("Testing HDF5 format execution...")
 
-    if not MIMIC_EXE.exists():
-        print(f"  Skipping (Mimic not built)")
-        return
-
-    # Check if HDF5 parameter file exists
-    param_file = TEST_DATA_DIR / "test_hdf5.yaml"
-    if not param_file.exists():
-        print(f"  Skipping (test_hdf5.yaml not found)")
-        return
-
-    # Run Mimic
-    returncode, stdout, stderr = run_mimic(param_file)
-
     # Check if HDF5 support is available
-    if returncode != 0:
-        output = (stdout + stderr).lower()
+    if mimic_hdf5_run.returncode != 0:
+        output = (mimic_hdf5_run.stdout + mimic_hdf5_run.stderr).lower()
         if "hdf5" in output and ("unknown" in output or "not supported" in output or "not compiled" in output):
-            print(f"  Skipping (Mimic not compiled with HDF5 support)")
-            print(f"  Rebuild with: make clean && make USE-HDF5=yes")
-            return
-        else:
-            assert False, f"Mimic failed with code {returncode}\nSTDERR: {stderr}"
+            pytest.skip("Mimic not compiled with HDF5 support "
+                        "(rebuild with: make clean && make USE-HDF5=yes)")
+        assert False, (f"Mimic failed with code {mimic_hdf5_run.returncode}\n"
+                       f"STDERR: {mimic_hdf5_run.stderr}")
 
     print(f"  ✓ HDF5 format execution successful")
 
 
-def test_hdf5_format_loading():
+def test_hdf5_format_loading(mimic_hdf5_run):
     """
     Test that HDF5 output file can be loaded and parsed
 
@@ -519,35 +467,20 @@ def test_hdf5_format_loading():
     """
     print("Testing HDF5 format data loading...")
 
-    if not MIMIC_EXE.exists():
-        print(f"  Skipping (Mimic not built)")
-        return
-
     # Check if HDF5 is supported
-    if not check_hdf5_support():
-        print(f"  Skipping (Mimic not compiled with HDF5 support)")
-        return
+    if not check_hdf5_support(mimic_hdf5_run):
+        pytest.skip("Mimic not compiled with HDF5 support")
 
     # Check output file exists
-    output_dir = TEST_DATA_DIR / "output" / "hdf5"
-    output_file = output_dir / "model_000.hdf5"  # filenr 0
-
-    # Run Mimic if needed
-    if not output_file.exists():
-        print(f"  Running Mimic to generate HDF5 output...")
-        param_file = TEST_DATA_DIR / "test_hdf5.yaml"
-        returncode, _, stderr = run_mimic(param_file)
-        assert returncode == 0, f"Mimic execution failed: {stderr}"
-
+    output_file = mimic_hdf5_run.output_dir / "model_000.hdf5"  # filenr 0
     assert output_file.exists(), f"HDF5 output file not created: {output_file}"
 
     # Check if h5py is available
     try:
         import h5py  # noqa: F401 - import used only for availability check
     except ImportError:
-        print(f"  Skipping detailed validation (h5py not available)")
-        print(f"  Install with: pip install h5py")
-        return
+        pytest.skip("h5py not available for detailed validation "
+                    "(install with: pip install h5py)")
 
     # Load halos
     print(f"  Loading: {output_file.relative_to(REPO_ROOT)}")
@@ -561,7 +494,7 @@ def test_hdf5_format_loading():
     print(f"    File size: {output_file.stat().st_size:,} bytes")
 
 
-def test_hdf5_baseline_comparison():
+def test_hdf5_baseline_comparison(mimic_hdf5_run):
     """
     Test that current HDF5 output matches committed baseline (core properties only)
 
@@ -585,41 +518,23 @@ def test_hdf5_baseline_comparison():
     """
     print("Testing HDF5 baseline comparison...")
 
-    if not MIMIC_EXE.exists():
-        print(f"  Skipping (Mimic not built)")
-        return
-
     # Check if HDF5 is supported
-    if not check_hdf5_support():
-        print(f"  Skipping (Mimic not compiled with HDF5 support)")
-        return
+    if not check_hdf5_support(mimic_hdf5_run):
+        pytest.skip("Mimic not compiled with HDF5 support")
 
     # Check if h5py is available
     try:
         import h5py  # noqa: F401 - import used only for availability check
     except ImportError:
-        print(f"  Skipping (h5py not available)")
-        return
+        pytest.skip("h5py not available")
 
     # Load current test output
-    output_dir = TEST_DATA_DIR / "output" / "hdf5"
-    output_file = output_dir / "model_000.hdf5"
-
-    # Run Mimic if needed
-    if not output_file.exists():
-        param_file = TEST_DATA_DIR / "test_hdf5.yaml"
-        returncode, _, stderr = run_mimic(param_file)
-        assert returncode == 0, f"Mimic execution failed: {stderr}"
+    output_file = mimic_hdf5_run.output_dir / "model_000.hdf5"
 
     print(f"  Loading CURRENT: {output_file.relative_to(REPO_ROOT)}")
     halos_test, metadata_test = load_hdf5_halos(output_file)
     print(f"    → {metadata_test['TotHalos']} halos")
 
-    # ANSI color codes
-    RED = '\033[0;31m'
-    GREEN = '\033[0;32m'
-    NC = '\033[0m'  # No Color
-
     # Load committed baseline
     baseline_dir = TEST_DATA_DIR / "output" / "baseline" / "hdf5"
     baseline_file = baseline_dir / "model_000.hdf5"
@@ -663,7 +578,7 @@ def test_hdf5_baseline_comparison():
     print(f"{GREEN}  ✓ HDF5 output matches baseline - all core properties validated{NC}")
 
 
-def test_format_equivalence():
+def test_format_equivalence(mimic_run, mimic_hdf5_run):
     """
     Test that binary and HDF5 formats produce identical output (all properties)
 
@@ -687,52 +602,27 @@ def test_format_equivalence():
     """
     print("Testing binary vs HDF5 format equivalence...")
 
-    if not MIMIC_EXE.exists():
-        print(f"  Skipping (Mimic not built)")
-        return
-
     # Check if HDF5 is supported
-    if not check_hdf5_support():
-        print(f"  Skipping (Mimic not compiled with HDF5 support)")
-        return
+    if not check_hdf5_support(mimic_hdf5_run):
+        pytest.skip("Mimic not compiled with HDF5 support")
 
     # Check if h5py is available
     try:
         import h5py  # noqa: F401 - import used only for availability check
     except ImportError:
-        print(f"  Skipping (h5py not available)")
-        return
+        pytest.skip("h5py not available")
 
     # Load current binary output
-    binary_dir = TEST_DATA_DIR / "output" / "binary"
-    binary_file = binary_dir / "model_z0.000_0"
-
-    # Run Mimic if needed
-    if not binary_file.exists():
-        print(f"  Running Mimic to generate binary output...")
-        param_file = TEST_DATA_DIR / "test_binary.yaml"
-        returncode, _, stderr = run_mimic(param_file)
-        assert returncode == 0, f"Binary Mimic execution failed: {stderr}"
+    binary_file = mimic_run.output_dir / "model_z0.000_0"
+    assert mimic_run.returncode == 0, \
+        f"Binary Mimic execution failed: {mimic_run.stderr}"
 
     print(f"  Loading BINARY: {binary_file.relative_to(REPO_ROOT)}")
     halos_binary, metadata_binary = load_binary_halos(binary_file)
     print(f"    → {metadata_binary['TotHalos']} halos")
 
     # Load current HDF5 output
-    hdf5_dir = TEST_DATA_DIR / "output" / "hdf5"
-    hdf5_file = hdf5_dir / "model_000.hdf5"
-
-    # Run Mimic if needed
-    if not hdf5_file.exists():
-        print(f"  Running Mimic to generate HDF5 output...")
-        param_file = TEST_DATA_DIR / "test_hdf5.yaml"
-        returncode, _, stderr = run_mimic(param_file)
-        assert returncode == 0, f"HDF5 Mimic execution failed: {stderr}"
-
-    # ANSI color codes
-    RED = '\033[0;31m'
-    GREEN = '\033[0;32m'
-    NC = '\033[0m'  # No Color
+    hdf5_file = mimic_hdf5_run.output_dir / "model_000.hdf5"
 
     print(f"  Loading HDF5: {hdf5_file.relative_to(REPO_ROOT)}")
     halos_hdf5, metadata_hdf5 = load_hdf5_halos(hdf5_file)
@@ -773,107 +663,11 @@ def test_format_equivalence():
     print(f"  Size ratio (HDF5/binary): {size_ratio:.2f}x")
 
 
-def main():
-    """
-    Main test runner
-
-    Executes all test cases and reports results.
-    """
-    print("Integration Test: Output Formats")
-    print(f"Repository root: {REPO_ROOT}")
-    print(f"Mimic executable: {MIMIC_EXE}")
-
-    # ANSI color codes
-    RED = '\033[0;31m'
-    NC = '\033[0m'  # No Color
-
-    # Check prerequisites
-    if not MIMIC_EXE.exists():
-        print(f"{RED}ERROR: Mimic executable not found: {MIMIC_EXE}{NC}")
-        print("Build it first with: make")
-        return 1
-
+if __name__ == "__main__":
+    # The tests share session fixtures, so they are run through pytest.
     # Testing Strategy:
     # - HDF5 baseline test validates core property determinism
     # - Format equivalence test validates binary matches HDF5 output
-    # - Binary baseline test is DISABLED: binary format cannot handle schema evolution
+    # - Binary baseline test is SKIPPED: binary format cannot handle schema evolution
     #   (not self-describing, loader uses current dtype which may differ from baseline)
-
-    tests = [
-        test_binary_format_execution,
-        test_binary_format_loading,
-        # test_binary_baseline_comparison,  # DISABLED: See note above
-        test_hdf5_format_execution,
-        test_hdf5_format_loading,
-        test_hdf5_baseline_comparison,  # Validates core property determinism
-        test_format_equivalence,  # Validates binary matches HDF5 (all properties)
-    ]
-
-    passed = 0
-    failed = 0
-    skipped = 0
-
-    # ANSI color codes
-    RED = '\033[0;31m'
-    GREEN = '\033[0;32m'
-    YELLOW = '\033[0;33m'
-    NC = '\033[0m'  # No Color
-
-    for test in tests:
-        print()
-        try:
-            # Capture print output to detect skips
-            import io
-            from contextlib import redirect_stdout
-
-            output_buffer = io.StringIO()
-            with redirect_stdout(output_buffer):
-                test()
-
-            output = output_buffer.getvalue()
-            print(output, end='')  # Print the output
-
-            if "Skipping" in output:
-                print(f"{YELLOW}⊘ SKIP: {test.__name__}{NC}")
-                skipped += 1
-            else:
-                passed += 1
-        except AssertionError as e:
-            # Print captured output before showing failure
-            output = output_buffer.getvalue()
-            if output:
-                print(output, end='')
-            print(f"{RED}✗ FAIL: {test.__name__}{NC}")
-            print(f"  {e}")
-            failed += 1
-        except Exception as e:
-            # Print captured output before showing error
-            output = output_buffer.getvalue()
-            if output:
-                print(output, end='')
-            print(f"{RED}✗ ERROR: {test.__name__}{NC}")
-            print(f"  {e}")
-            failed += 1
-
-    print()
-    print("=" * 60)
-    print("Test Summary: Output Formats")
-    print("=" * 60)
-    print(f"Passed:  {passed}")
-    print(f"Failed:  {failed}")
-    print(f"Skipped: {skipped}")
-    print(f"Total:   {passed + failed + skipped}")
-    print("=" * 60)
-
-    if failed == 0:
-        print(f"{GREEN}✓ All executed tests passed!{NC}")
-        if skipped > 0:
-            print(f"{YELLOW}⊘ {skipped} test(s) skipped (HDF5 support not available){NC}")
-        return 0
-    else:
-        print(f"{RED}✗ {failed} test(s) failed{NC}")
-        return 1
-
-
-if __name__ == "__main__":
-    sys.exit(main())
+    sys.exit(pytest.main([__file__, "-v"]))
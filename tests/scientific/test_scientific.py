@@ -26,37 +26,31 @@ Author: Mimic Testing Team
 Date: 2025-11-11 (Updated for metadata-driven validation)
 """
 
-import subprocess
 import sys
 from pathlib import Path
 import numpy as np
 import json
+import warnings
+import pytest
 
 # Add framework to path
 REPO_ROOT = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(REPO_ROOT / "tests"))
 
-from framework import load_binary_halos
+from framework import ensure_output_dirs, load_binary_halos, run_mimic
 
 # Repository paths
 TEST_DATA_DIR = REPO_ROOT / "tests" / "data"
 MIMIC_EXE = REPO_ROOT / "mimic"
 
 
-def ensure_output_dirs():
-    """
-    Create output directories if they don't exist
-
-    Creates the binary and HDF5 output directories required by test parameter files.
-    This ensures tests work correctly after make test-clean or in fresh clones.
-    """
-    (TEST_DATA_DIR / "output" / "binary").mkdir(parents=True, exist_ok=True)
-    (TEST_DATA_DIR / "output" / "hdf5").mkdir(parents=True, exist_ok=True)
-
-
 # Ensure output directories exist before any tests run
 ensure_output_dirs()
 
+# Every test here runs Mimic into the shared tests/data/output/ tree; under
+# pytest-xdist (--dist loadgroup) they all stay on one worker
+pytestmark = pytest.mark.xdist_group("tests_data_output")
+
 # Validation manifest (auto-generated by scripts/generate_properties.py)
 VALIDATION_MANIFEST_PATH = REPO_ROOT / "tests" / "generated" / "property_ranges.json"
 
@@ -80,16 +74,11 @@ def run_mimic_if_needed():
     if not output_file.exists():
         print("  Running Mimic to generate output...")
         param_file = TEST_DATA_DIR / "test_binary.yaml"
-        result = subprocess.run(
-            [str(MIMIC_EXE), str(param_file)],
-            cwd=str(REPO_ROOT),
-            capture_output=True,
-            text=True
-        )
-        if result.returncode != 0:
-            print(f"STDOUT:\n{result.stdout}")
-            print(f"STDERR:\n{result.stderr}")
-            raise RuntimeError(f"Mimic execution failed with code {result.returncode}")
+        returncode, stdout, stderr = run_mimic(param_file)
+        if returncode != 0:
+            print(f"STDOUT:\n{stdout}")
+            print(f"STDERR:\n{stderr}")
+            raise RuntimeError(f"Mimic execution failed with code {returncode}")
 
     return output_file
 
@@ -260,8 +249,7 @@ def test_numerical_validity():
     print("="*60)
 
     if not MIMIC_EXE.exists():
-        print(f"  Skipping (Mimic not built)")
-        return True, 0
+        pytest.skip("Mimic not built")
 
     output_file = run_mimic_if_needed()
     halos, metadata = load_binary_halos(output_file)
@@ -276,7 +264,6 @@ def test_numerical_validity():
             if info['examples']:
                 for idx, val in info['examples']:
                     print(f"    Halo {idx}: {field} = {val}")
-        return False, 1
 
     if result['inf_fields']:
         print(f"{RED}✗ FAIL: Found Inf values in {len(result['inf_fields'])} field(s):{NC}")
@@ -285,10 +272,11 @@ def test_numerical_validity():
             if info['examples']:
                 for idx, val in info['examples']:
                     print(f"    Halo {idx}: {field} = {val}")
-        return False, 1
 
+    assert result['passed'], (
+        f"NaN/Inf values in: {sorted({**result['nan_fields'], **result['inf_fields']})}"
+    )
     print(f"{GREEN}✓ PASS: No NaN or Inf values found{NC}")
-    return True, 0
 
 
 def test_zero_values():
@@ -306,18 +294,16 @@ def test_zero_values():
         print(f"{YELLOW}⚠ WARNING: Validation manifest not found: {VALIDATION_MANIFEST_PATH}{NC}")
         print("  Run 'make generate' to create property_ranges.json from YAML metadata.")
         print("  Skipping zero-value checks.")
-        return True, 0
+        pytest.skip("validation manifest not found")
 
     try:
         with open(VALIDATION_MANIFEST_PATH) as f:
             manifest = json.load(f)
     except Exception as e:
-        print(f"{RED}✗ FAIL: Could not parse validation manifest: {e}{NC}")
-        return False, 1
+        pytest.fail(f"{RED}✗ FAIL: Could not parse validation manifest: {e}{NC}")
 
     if not MIMIC_EXE.exists():
-        print(f"  Skipping (Mimic not built)")
-        return True, 0
+        pytest.skip("Mimic not built")
 
     output_file = run_mimic_if_needed()
     halos, metadata = load_binary_halos(output_file)
@@ -332,10 +318,10 @@ def test_zero_values():
             print(f"  {field}: {info['count']} zero values out of {total_halos} total")
             for idx, val in info['examples'][:3]:  # Limit to 3 examples
                 print(f"    Halo {idx}: {field} = {val}")
-        return True, len(zero_counts)  # Warnings, not failures
+        # Warnings, not failures
+        warnings.warn(f"Zero values in {len(zero_counts)} field(s): {', '.join(zero_counts)}")
     else:
         print(f"{GREEN}✓ No unexpected zero values found{NC}")
-        return True, 0
 
 
 def test_physical_ranges():
@@ -352,18 +338,16 @@ def test_physical_ranges():
         print(f"{YELLOW}⚠ WARNING: Validation manifest not found: {VALIDATION_MANIFEST_PATH}{NC}")
         print("  Run 'make generate' to create property_ranges.json from YAML metadata.")
         print("  Skipping range validation.")
-        return True, 0
+        pytest.skip("validation manifest not found")
 
     try:
         with open(VALIDATION_MANIFEST_PATH) as f:
             manifest = json.load(f)
     except Exception as e:
-        print(f"{RED}✗ FAIL: Could not parse validation manifest: {e}{NC}")
-        return False, 1
+        pytest.fail(f"{RED}✗ FAIL: Could not parse validation manifest: {e}{NC}")
 
     if not MIMIC_EXE.exists():
-        print(f"  Skipping (Mimic not built)")
-        return True, 0
+        pytest.skip("Mimic not built")
 
     output_file = run_mimic_if_needed()
     halos, metadata = load_binary_halos(output_file)
@@ -446,68 +430,8 @@ def test_physical_ranges():
                 print(f"{GREEN}✓ PASS: {field} components within [{rmin}, {rmax}] (inclusive){NC}")
 
     print()
-    return failures == 0, failures
-
-
-def main():
-    """
-    Main test runner
-    """
-    print("Scientific Validation Test")
-    print(f"Repository root: {REPO_ROOT}")
-    print(f"Mimic executable: {MIMIC_EXE}")
-
-    # Check prerequisites
-    if not MIMIC_EXE.exists():
-        print(f"{RED}ERROR: Mimic executable not found: {MIMIC_EXE}{NC}")
-        print("Build it first with: make")
-        return 1
-
-    # Run test sections
-    passed_sections = 0
-    failed_sections = 0
-    warning_count = 0
-
-    # 1. Numerical validity (critical)
-    passed, failures = test_numerical_validity()
-    if passed:
-        passed_sections += 1
-    else:
-        failed_sections += failures
-
-    # 2. Zero values (warnings)
-    passed, warnings = test_zero_values()
-    warning_count = warnings
-    if passed:
-        passed_sections += 1
-
-    # 3. Physical ranges
-    passed, failures = test_physical_ranges()
-    if passed:
-        passed_sections += 1
-    else:
-        failed_sections += failures
-
-    # Summary
-    print("=" * 60)
-    print("Test Summary: Scientific Validation")
-    print("=" * 60)
-    print(f"Sections passed: {passed_sections}")
-    print(f"Sections failed: {failed_sections}")
-    if warning_count > 0:
-        print(f"{YELLOW}Warnings: {warning_count} field(s) with zero values{NC}")
-    print("=" * 60)
-
-    if failed_sections == 0:
-        if warning_count > 0:
-            print(f"{YELLOW}✓ All tests passed (with warnings){NC}")
-        else:
-            print(f"{GREEN}✓ All tests passed!{NC}")
-        return 0
-    else:
-        print(f"{RED}✗ {failed_sections} test(s) failed{NC}")
-        return 1
+    assert failures == 0, f"{failures} field(s) outside their metadata ranges"
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    sys.exit(pytest.main([__file__, "-v"]))